@@ -3,14 +3,37 @@
 time associated with each parametrization and is compatible with the BBO
 standards by having a compute method."""
 
+import getpass
 from pathlib import Path
 from shutil import copyfile
 import subprocess
-from shlex import split
-from typing import List, Iterable
+import time
+from typing import Dict, List, Iterable
 
 from loguru import logger
-from .tunable_component.component import TunableComponent
+from .tunable_component.component import TunableComponent, load_components
+
+# Time during which the output of squeue is reused, in seconds
+SQUEUE_TTL = 1.0
+
+
+def parse_squeue_time(raw_time: str) -> int:
+    """Converts a time formatted by squeue ([days-][hours:]minutes:seconds)
+    into seconds.
+
+    Args:
+        raw_time (str): The time as formatted by squeue.
+
+    Returns:
+        int: The time in seconds.
+    """
+    days, _, clock = raw_time.rpartition("-")
+    seconds = 0
+    for value in clock.split(":"):
+        seconds = seconds * 60 + int(value)
+    if days:
+        seconds += int(days) * 24 * 3600
+    return seconds
 
 
 class BBWrapper:
@@ -23,7 +46,8 @@ class BBWrapper:
         parameter_names: List[str],
         sbatch_file: str,
         component_configuration: str = "",
-        sbatch_dir: str = Path.cwd(),
+        sbatch_dir: str = None,
+        cache_repeats: bool = False,
     ) -> None:
         """Creates an object of class AccBlackBox, with the accelerator
         accelerator_name and the file sbatch_file.
@@ -38,19 +62,35 @@ class BBWrapper:
                 a API connection.
             sbatch_file (str): The path to the sbatch file to launch.
             sbatch_dir (str): The path to the directory where the sbatch file
-                is generated.
+                is generated. Defaults to the current working directory.
+            cache_repeats (bool): Whether or not to reuse the target value of
+                a parametrization which has already been run instead of
+                running it again. Must be left disabled when the target is
+                noisy and the parametrizations are resampled.
         """
         self.component_name = component_name
         self.parameter_names = parameter_names
         self.component_configuration = component_configuration
+        if sbatch_dir is None:
+            sbatch_dir = Path.cwd()
         self.sbatch_dir = (
             Path(sbatch_dir) if not isinstance(
                 sbatch_dir, Path) else sbatch_dir
         )
         self.sbatch_file = self.copy_sbatch(sbatch_file)
+        # The description of the components, loaded on first use and shared
+        # by all the components setup by the black-box
+        self._components = None
 
         # The list of jobids that have been run through the blackbox
         self.jobids = list()
+        # The job id and the target value of each parametrization already
+        # run, if they are reused
+        self.cache_repeats = cache_repeats
+        self._target_values = dict()
+        # The id of the job reused by the last computation, if its target
+        # value came from the cache
+        self._reused_jobid = None
 
         # Attributes concerning the default run
         # The jobid of the run using default parameters
@@ -60,6 +100,19 @@ class BBWrapper:
         # The default paremeters
         self.default_parameters = None
 
+        # The running time of the jobs in the queue, as parsed from the last
+        # call to squeue, and the moment of this call
+        self._squeue_elapsed_times = dict()
+        self._squeue_timestamp = None
+
+    @property
+    def components(self):
+        """The description of the registered components, loaded only once
+        from the component configuration."""
+        if self._components is None:
+            self._components = load_components(self.component_configuration)
+        return self._components
+
     def copy_sbatch(self, sbatch_file: str) -> str:
         """This method copies the sbatch in order to transform it into a timed
         sbatch which can be used by the optimizer. This sbatch file will be
@@ -77,41 +130,38 @@ class BBWrapper:
         self.sbatch_dir.mkdir(exist_ok=True)
         new_path = self.sbatch_dir / \
             (str(Path(sbatch_file).stem) + "_shaman.sbatch")
-        copy_sbatch = open(new_path, "w")
-        # Check if file is already timed
-        with open(sbatch_file, "r") as read_file:
-            lines = read_file.readlines()
-            # For each line in the original sbatch
-            for enum, line in enumerate(lines):
+        with open(sbatch_file, "r") as read_file, \
+                open(new_path, "w") as copy_sbatch:
+            # Stream the original sbatch, keeping the previous line in order
+            # to look ahead by one line
+            previous_line = None
+            for line in read_file:
                 # If the line is timed already, break by copying the file
                 if line.startswith("time"):
                     logger.debug(
                         f"File {sbatch_file} is alread timed, escaping.")
                     direct_copy = True
                     break
-                # Write the current line and break
+                # If the previous line starts with # and not the current one
+                # and the time command has not yet been written
+                if previous_line is not None \
+                        and previous_line.startswith("#") \
+                        and not line.startswith("#") \
+                        and not timed_written:
+                    copy_sbatch.write("time (" + "\n")
+                    # Set time written to true
+                    timed_written = True
+                    logger.debug(f"Added time command to file {new_path}")
+                # Write the current line
                 copy_sbatch.write(line)
-                # If the line starts with # and not at the end of file
-                if line.startswith("#") and enum < len(lines) - 1:
-                    following_line = lines[enum + 1]
-                    # And not the following one and the time command has not
-                    # yet been written
-                    if not following_line.startswith("#") \
-                            and not timed_written:
-                        copy_sbatch.write("time (" + "\n")
-                        # Set time written to true
-                        timed_written = True
-                        logger.debug(f"Added time command to file {new_path}")
-            if direct_copy:
-                # Leave the started file
-                # and directly copy the original timed file
-                copy_sbatch.close()
-                copyfile(sbatch_file, new_path)
-            else:
-                # Close parenthesis and file
+                previous_line = line
+            # Close parenthesis
+            if not direct_copy:
                 copy_sbatch.write(")")
-                copy_sbatch.close()
-            return new_path
+        if direct_copy:
+            # Directly copy the original timed file over the started one
+            copyfile(sbatch_file, new_path)
+        return new_path
 
     def setup_component(self, parameters: Iterable) -> None:
         """Setsup the component with the right configuration and the right
@@ -132,6 +182,7 @@ class BBWrapper:
             self.component_name,
             module_configuration=self.component_configuration,
             parameters=parameter_dict,
+            components=self.components,
         )
 
     def compute(self, parameters: Iterable) -> float:
@@ -144,6 +195,16 @@ class BBWrapper:
         Returns:
             The time spent to run the sbatch.
         """
+        key = tuple(parameters)
+        # Reuse the result of the parametrization if it has already been run
+        if self.cache_repeats and key in self._target_values:
+            job_id, target_value = self._target_values[key]
+            logger.debug(
+                f"Reusing the target value {target_value} of job {job_id}")
+            self.jobids.append(job_id)
+            self._reused_jobid = job_id
+            return target_value
+        self._reused_jobid = None
         # Setup the component
         self.setup_component(parameters)
         # Submit the sbatch using the accelerator
@@ -152,6 +213,8 @@ class BBWrapper:
         self.jobids.append(job_id)
         target_value = self.component.get_target(job_id)
         logger.debug(f"Application target value: {target_value}")
+        if self.cache_repeats:
+            self._target_values[key] = (job_id, target_value)
         return target_value
 
     def run_default(self) -> float:
@@ -159,7 +222,9 @@ class BBWrapper:
         the IOModules configuration file."""
         # Submit the sbatch using the accelerator
         self.default_component = TunableComponent(
-            self.component_name, self.component_configuration
+            self.component_name,
+            self.component_configuration,
+            components=self.components,
         )
         # Log the output
         logger.debug(
@@ -178,6 +243,15 @@ class BBWrapper:
         self.default_target_value = target_value
         return target_value
 
+    @property
+    def current_jobid(self) -> int:
+        """The id of the job of the last computation: the job whose target
+        value was reused from the cache, or else the last job submitted by
+        the component."""
+        if self._reused_jobid is not None:
+            return self._reused_jobid
+        return self.component.submitted_jobids[-1]
+
     def step_cost_function(self) -> float:
         """Defines a custom cost function in order to be able to use BBO
         asynchronously.
@@ -185,42 +259,61 @@ class BBWrapper:
         It computes the slurm running time of the currently running job
         (i.e. the last element of the currently running jobid).
         """
-        return self.parse_job_elapsed_time(self.component.submitted_jobids[-1])
+        return self.parse_job_elapsed_time(self.current_jobid)
 
     def on_interrupt(self) -> None:
         """If the .compute method of the black-box is called scancel the last
         job."""
-        self.scancel_job(self.component.submitted_jobids[-1])
+        self.scancel_job(self.current_jobid)
 
-    @staticmethod
-    def parse_job_elapsed_time(job_id: int) -> float:
-        """Given a Slurm jobid, parses the output of the squeue command for
-        this job in order to return the running time.
+    def parse_job_elapsed_time(self, job_id: int) -> float:
+        """Given a Slurm jobid, returns the time the job has been running, as
+        reported by the squeue command.
+
+        The running times of all the jobs of the user are read with a single
+        call to squeue, which is reused for SQUEUE_TTL seconds: as squeue
+        reports the running times to the second, polling it more often only
+        puts load on the Slurm controller.
 
         Args:
             job_id (int): The slurm ID of the job.
 
         Returns:
-            float: The time the job has been running.
+            float: The time the job has been running, or 0 if the job is not
+                in the queue anymore.
+        """
+        now = time.monotonic()
+        if self._squeue_timestamp is None \
+                or now - self._squeue_timestamp >= SQUEUE_TTL:
+            self._squeue_elapsed_times = self.parse_squeue_elapsed_times()
+            self._squeue_timestamp = now
+        return self._squeue_elapsed_times.get(int(job_id), 0)
+
+    @staticmethod
+    def parse_squeue_elapsed_times() -> Dict[int, int]:
+        """Parses the output of the squeue command in order to return the
+        running time of each job of the user.
+
+        Returns:
+            dict: The running time in seconds of each job, indexed by the id
+                of the job.
         """
         sub_ps = subprocess.run(
-            split(f"squeue -j {job_id}"),
+            ["squeue", "--noheader", "--user", getpass.getuser(),
+             "--format", "%i %M"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
         )
-        output_stdout = sub_ps.stdout.decode()
-        if output_stdout:
+        elapsed_times = dict()
+        for line in sub_ps.stdout.splitlines():
             try:
-                # Try to parse the output of the squeue command
-                # If it returns a ValueError,
-                # it means that the job is already over
-                # Set the resulting time to 0
-                raw_time = output_stdout.split(" ")[-8].split(":")
-                time_in_second = int(raw_time[0]) * 60 + int(raw_time[1])
-                return time_in_second
+                job_id, raw_time = line.split()
+                elapsed_times[int(job_id)] = parse_squeue_time(raw_time)
+            # Skip the lines which can't be parsed (e.g. job arrays)
             except ValueError:
-                return 0
-        return 0
+                continue
+        return elapsed_times
 
     @staticmethod
     def scancel_job(job_id: int) -> None:
@@ -230,7 +323,7 @@ class BBWrapper:
             job_id (int): The id of the job to cancel.
         """
         sub_ps = subprocess.run(
-            split(f"scancel {job_id}"),
+            ["scancel", str(job_id)],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
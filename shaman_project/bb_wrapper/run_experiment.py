@@ -78,6 +78,8 @@ def run(
             f"{experiment_name}: {e}"
         )
         experiment.fail()
+    finally:
+        experiment.close()
 
 
 cli.command()(run)
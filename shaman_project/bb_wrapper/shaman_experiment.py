@@ -111,7 +111,9 @@ class SHAManExperiment:
         self.configuration = SHAManConfig.from_yaml(
             configuration_file, self.component_name
         )
-        # Create API client using the configuration information
+        # Create API client using the configuration information, whose
+        # connections are kept alive and reused by all the requests of the
+        # experiment until it is closed
         self.api_client = Client(base_url=self.api_url, proxies={})
         # Create the black box object using the informations
         self.bb_wrapper = BBWrapper(
@@ -122,15 +124,25 @@ class SHAManExperiment:
             component_configuration=self.api_url
             + "/"
             + api_settings.component_endpoint,
+            cache_repeats=self.configuration.experiment.cache_repeats,
         )
         logger.debug(self.api_url + "/" + api_settings.component_endpoint)
 
-        # Setup black box optimizer using configuration information
-        self.bb_optimizer = self.setup_bb_optimizer()
+        # The black box optimizer is only setup on first use, which is at the
+        # start of the launch when running the experiment
+        self._bb_optimizer = None
         # Compute the start of the experiment
         self.experiment_start = \
             datetime.datetime.utcnow().strftime("%y/%m/%d %H:%M:%S")
 
+    @property
+    def bb_optimizer(self) -> BBOptimizer:
+        """The black box optimizer, setup from the configuration on first
+        access."""
+        if self._bb_optimizer is None:
+            self.setup_bb_optimizer()
+        return self._bb_optimizer
+
     def setup_bb_optimizer(self) -> BBOptimizer:
         """Setups the black-box from the configuration."""
         # Create the BBOptimizer object using the different options in the
@@ -147,7 +159,7 @@ class SHAManExperiment:
             max_step_cost = None
             pruning = False
 
-        self.bb_optimizer = BBOptimizer(
+        self._bb_optimizer = BBOptimizer(
             black_box=self.bb_wrapper,
             parameter_space=self.configuration.component_parameter_space,
             max_iteration=self.nbr_iteration,
@@ -155,10 +167,14 @@ class SHAManExperiment:
             max_step_cost=max_step_cost,
             **self.configuration.bbo_parameters,
         )
-        return self.bb_optimizer
+        return self._bb_optimizer
 
     def launch(self) -> None:
         """Launches the tuning experiment."""
+        # Setup the optimizer before creating the experiment, so that an
+        # invalid configuration is rejected before any request is sent
+        logger.debug("Initializing black box optimizer.")
+        self.setup_bb_optimizer()
         logger.debug("Creating experiment.")
         # Create the experiment through API request
         self.create_experiment()
@@ -166,9 +182,13 @@ class SHAManExperiment:
             # Launch a run using default parameterization of the component
             logger.info("Running application with default parametrization.")
             self.bb_wrapper.run_default()
-        # Setup the optimizer
-        logger.debug("Initializing black box optimizer.")
-        self.setup_bb_optimizer()
+            # The maximum step duration of the pruning may be the time of the
+            # default run, in which case the optimizer is setup again
+            if (
+                self.configuration.pruning
+                and self.configuration.pruning.max_step_duration == "default"
+            ):
+                self.setup_bb_optimizer()
         # Launch the optimization
         logger.debug("Launching optimization.")
         self.bb_optimizer.optimize(callbacks=[self.update_history])
@@ -212,13 +232,16 @@ class SHAManExperiment:
     @property
     def start_experiment_dict(self) -> Dict:
         """Creates a dictionnary describing the experiment from its start."""
+        experiment_parameters = dict(self.configuration.bbo)
+        if self.configuration.noise_reduction:
+            experiment_parameters.update(self.configuration.noise_reduction)
         return InitExperiment(
             **{
                 "experiment_name": self.experiment_name,
                 "experiment_start": self.experiment_start,
                 "experiment_budget": self.nbr_iteration,
                 "component": self.component_name,
-                "experiment_parameters": dict(self.configuration.bbo),
+                "experiment_parameters": experiment_parameters,
                 "noise_reduction_strategy":
                 dict(self.configuration.noise_reduction)
                 if self.configuration.noise_reduction
@@ -296,7 +319,7 @@ class SHAManExperiment:
         logger.debug(f"Best performance so far: {best_fitness}")
         return IntermediateResult(
             **{
-                "jobids": self.bb_wrapper.component.submitted_jobids[-1],
+                "jobids": self.bb_wrapper.current_jobid,
                 "fitness": list(history["fitness"])[-1],
                 "parameters": self.build_parameter_dict(
                     self.configuration.component_parameter_names,
@@ -324,11 +347,11 @@ class SHAManExperiment:
         Args:
             history (dict): The BBO history
         """
-        logger.debug(
-            f"Writing update dictionary {self._updated_dict(history)}")
+        # Build the dictionary once, for both the log and the request
+        updated_dict = self._updated_dict(history)
+        logger.debug(f"Writing update dictionary {updated_dict}")
         request = self.api_client.put(
-            f"experiments/{self.experiment_id}/update",
-            json=self._updated_dict(history)
+            f"experiments/{self.experiment_id}/update", json=updated_dict
         )
         if not 200 <= request.status_code < 400:
             self.fail()
@@ -408,6 +431,10 @@ class SHAManExperiment:
                 f"{request.status_code}"
             )
 
+    def close(self):
+        """Close the connections to the API, once the experiment is over."""
+        self.api_client.close()
+
     def summarize(self):
         """Summarize the experiment by printing out the best parametrization,
         the associated fitness, and the BBO summary."""
@@ -13,29 +13,117 @@ file, before instanciating the class.
 Of course, a child class can add any wanted new methods specific to the
 tunable component.
 """
+import functools
 import os
 
 import pty
+import re
 import subprocess
-from shlex import split
+import tempfile
+import threading
 from pathlib import Path
 from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
-from shaman_core.models.component_model import TunableComponentsModel
+from shaman_core.models.component_model import (
+    TunableComponentModel,
+    TunableComponentsModel,
+)
 
 
-# Save current environment as variable
-ENV = os.environ.copy()
+# The message printed by sbatch once the job has been submitted
+JOBID_PATTERN = re.compile(r"Submitted batch job (\d+)")
+
+# The sbatch files with a header are only read once by sbatch, so they are
+# written to memory when possible rather than to the shared file system
+SBATCH_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
 
 # TODO: Add custom components support
 
 
+def load_components(
+    module_configuration: str,
+) -> Dict[str, TunableComponentModel]:
+    """Loads the description of the components, given the path to their
+    configuration.
+
+    Args:
+        module_configuration (str): The path to the configuration file of
+            the components, either as a YAML file or an URL.
+
+    Returns:
+        dict: The description of each component, indexed by their name.
+    """
+    # Check if the configuration file is an URL and try loading
+    if ("http://" or "https://") in str(module_configuration):
+        possible_components = TunableComponentsModel.from_api(
+            module_configuration
+        ).components
+    # Else, check if it's a file
+    else:
+        # If it's a YAML
+        if Path(module_configuration).suffix == ".yaml":
+            # Load it, the loader tells if it exists
+            try:
+                possible_components = TunableComponentsModel.from_yaml(
+                    module_configuration
+                ).components
+            # If the file itself can't be found or is a directory, raise an
+            # error, but let through the errors raised for other files
+            except (FileNotFoundError, IsADirectoryError) as error:
+                if error.filename is None or Path(error.filename).resolve() \
+                        != Path(module_configuration).resolve():
+                    raise
+                raise FileNotFoundError(
+                    "Module configuration can't be found. "
+                    "Please make sure this file exist."
+                ) from error
+        # If it's not a YAML, raise an error
+        else:
+            raise ValueError("File must have a YAML format.")
+    return possible_components
+
+
+@functools.lru_cache(maxsize=32)
+def _split_sbatch(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[str, Optional[str]]:
+    """Splits the sbatch located at path where the header of a component
+    must be added, i.e. after the first line starting by # which is followed
+    by a line which does not.
+
+    The results are memoized on the path, the modification time and the size
+    of the file, so that the sbatch is only read once per process when it is
+    submitted repeatedly, as long as it is left untouched.
+
+    Args:
+        path (str): The resolved path to the sbatch.
+        mtime_ns (int): The modification time of the sbatch, in nanoseconds.
+        size (int): The size of the sbatch, in bytes.
+
+    Returns:
+        tuple: The content of the sbatch before and after the header, or the
+            whole content and None if there is nowhere to add the header.
+    """
+    with open(path, "r") as read_file:
+        lines = read_file.readlines()
+    for index in range(len(lines) - 1):
+        if lines[index].startswith("#") \
+                and not lines[index + 1].startswith("#"):
+            return "".join(lines[:index + 1]), "".join(lines[index + 1:])
+    return "".join(lines), None
+
+
 class TunableComponent:
     """Abstract class representing a tunable component."""
 
     def __init__(
-        self, name: str, module_configuration: str, parameters: dict = dict()
+        self,
+        name: str,
+        module_configuration: str,
+        parameters: dict = dict(),
+        components: Optional[Dict[str, TunableComponentModel]] = None,
     ) -> None:
         """Creates a TunableComponent object, given its configuration file.
 
@@ -44,30 +132,16 @@ class TunableComponent:
             module_configuration (str): The path to the configuration file of
                 the component, either as a YAML file or an URL.
             parameters (dict): The parameters to setup the component.
+            components (dict): The already loaded description of the
+                components, to avoid loading the configuration again. If
+                None, the components are loaded from module_configuration.
         """
-        # Check if the configuration file is an URL and try loading
-        if ("http://" or "https://") in str(module_configuration):
-            possible_components = TunableComponentsModel.from_api(
-                module_configuration
-            ).components
-        # Else, check if it's a file
-        else:
-            # If it's a YAML
-            if Path(module_configuration).suffix == ".yaml":
-                # If it exists
-                if Path(module_configuration).is_file():
-                    possible_components = TunableComponentsModel.from_yaml(
-                        module_configuration
-                    ).components
-                # If the file can't be found, raise an error
-                else:
-                    raise FileNotFoundError(
-                        "Module configuration can't be found."
-                        "Please make sure this file exist."
-                    )
-            # If it's not a YAML, raise an error
-            else:
-                raise ValueError("File must have a YAML format.")
+        # Load the components, unless they have already been loaded
+        possible_components = (
+            components
+            if components is not None
+            else load_components(module_configuration)
+        )
 
         try:
             self.description = possible_components[name]
@@ -93,39 +167,80 @@ class TunableComponent:
         # them with their default value
         # if unspecified
 
-        self.var_env = ENV
-        # The dictionary containing the environment variables
-
-        self.submitted_jobids = list()
+        self._env_params = [
+            param
+            for param, param_value in self.parameters_description.items()
+            if param_value.env_var and self.parameters.get(param)
+        ]
+        self._cmd_params = [
+            param
+            for param, param_value in self.parameters_description.items()
+            if param_value.cmd_var
+        ]
+        self._cli_params = [
+            param
+            for param, param_value in self.parameters_description.items()
+            if param_value.cli_var
+        ]
+        # The parameters set as environment variables, command line variables
+        # and sbatch command line variables, computed once as the parameters
+        # do not change once sanitized
+
+        self._cmd_line = None
+        # The command line of the component, built on first access
+
+        self.var_env = None
+        # The dictionary containing the environment variables, copied from
+        # the current environment when the first variable is set (None means
+        # that the current environment is inherited)
+
+        self._var_env_ready = False
+        # Whether the environment variables have already been setup
+
+        self.submitted_jobids = []
         # List of the jobs that have been submitted using the accelerator
 
+        self.jobid_submitted = threading.Event()
+        # Event set once a job has been submitted using the accelerator, so
+        # that other threads can wait for it
+
     def build_cmd_line(self, param: str) -> str:
         """Build a command line variable given a parameter and its different
         attributes (suffix, flag).
 
         Args:
             param (str): The name of the parameter to use.
+
+        Returns:
+            str: the command line variable, or an empty string if the
+                parameter has no value.
+        """
+        return " ".join(self._build_cmd_arguments(param))
+
+    def _build_cmd_arguments(self, param: str) -> List[str]:
+        """Build the arguments of a command line variable given a parameter
+        and its different attributes (suffix, flag).
+
+        Args:
+            param (str): The name of the parameter to use.
+
+        Returns:
+            list of str: the arguments of the command line variable, empty if
+                the parameter has no value.
         """
         param_value = self.parameters_description[param]
-        cmd_line = ""
-        # If there is a value for the parameter
-        if self.parameters.get(param):
-            # If there is a suffix, assign it, else use empty string
-            suffix = param_value.suffix if param_value.suffix else ""
-            # If there is a string value
+        value = self.parameters.get(param)
+        # If there is no value for the parameter
+        if not value:
+            return []
+        # If there is a suffix, assign it, else use empty string
+        suffix = param_value.suffix if param_value.suffix else ""
+        # If there is a flag
+        if param_value.flag:
             # If the string for the flag is bigger than 1, use --
-            if param_value.flag:
-                if len(param_value.flag) > 1:
-                    cmd_line += f" --{param_value.flag} " \
-                        f"{self.parameters.get(param)}"
-                else:
-                    cmd_line += f" -{param_value.flag} " \
-                        f"{self.parameters.get(param)}"
-            else:
-                cmd_line += f"{param}={self.parameters.get(param)}"
-            # Add suffix at the end of the command variable
-            cmd_line += f"{suffix} "
-        return cmd_line
+            dash = "--" if len(param_value.flag) > 1 else "-"
+            return [f"{dash}{param_value.flag}", f"{value}{suffix}"]
+        return [f"{param}={value}{suffix}"]
 
     @ property
     def cmd_line(self) -> str:
@@ -133,24 +248,45 @@ class TunableComponent:
         in order to build a command line that can be used to launch the
         component. If there is no command, returns an empty.
 
+        As the parameters do not change once sanitized, the command line is
+        only built on first access.
+
+        Returns:
+            str: the corresponding command line.
+        """
+        if self._cmd_line is None:
+            self._cmd_line = self._build_component_cmd_line()
+        return self._cmd_line
+
+    def _build_component_cmd_line(self) -> str:
+        """Builds the command line used to launch the component.
+
         Returns:
             str: the corresponding command line.
         """
         if not self.description.command:
             return ""
-        else:
-            cmd_line = ""
-            # Iterate over each parameter
-            for param, param_value in self.parameters_description.items():
-                if param_value.cmd_var:
-                    cmd_line += self.build_cmd_line(param) + " "
-            return self.description.command + " " + " ".join(cmd_line.split())
+        # If there is no command line parameter, only use the command
+        if not self._cmd_params:
+            return self.description.command
+        cmd_line = [self.description.command]
+        # Iterate over each command line parameter
+        for param in self._cmd_params:
+            cmd_var = self.build_cmd_line(param)
+            if cmd_var:
+                cmd_line.append(cmd_var)
+        return " ".join(cmd_line)
 
     def add_header_sbatch(self, sbatch_file: str) -> str:
         """Adds the header, the LD_PRELOAD and the command line corresponding
         to the component to the sbatch file. The header is added to the first
         line which doesn't start by #SBATCH.
 
+        The new sbatch is a temporary file, with a unique name so that
+        concurrent submissions don't overwrite each other, which must be
+        removed by the caller once submitted. The content of the original
+        sbatch is only read again when it has been modified.
+
         Args:
             sbatch_file (str): The path to the sbatch where the header
                 should be added.
@@ -158,51 +294,55 @@ class TunableComponent:
         Returns:
             str: the path to the newly created sbatch.
         """
-        written = False
-        copy_sbatch_path = f"{Path(sbatch_file).stem}_header.sbatch"
-        copy_sbatch = open(copy_sbatch_path, "w")
-        with open(sbatch_file, "r") as read_file:
-            # For each line in the original sbatch
-            lines = read_file.readlines()
-            for enum, line in enumerate(lines):
-                # Write the current line and break
-                copy_sbatch.write(line)
-                # If the line starts with # and not at the end of file
-                if line.startswith("#") and enum < len(line) - 2 \
-                        and not written:
-                    following_line = lines[enum + 1]
-                    # And not the following one
-                    if not following_line.startswith("#"):
-                        # Add the command line if exists
-                        if self.cmd_line:
-                            logger.info(
-                                "Writing command line on top of sbatch:"
-                                f"{self.cmd_line}"
-                            )
-                            copy_sbatch.write(self.cmd_line + "\n")
-                        # Add the header at the beginning of the
-                        # script if exists
-                        if self.description.header:
-                            logger.info(
-                                "Writing header on top of sbatch"
-                                f"{self.description.header}"
-                            )
-                            copy_sbatch.write(self.description.header + "\n")
-                        # Add the ld preload at the beginningof
-                        # the script if exists
-                        if self.description.ld_preload:
-                            logger.info(
-                                "Writing LD_PRELOAD on top of sbatch:"
-                                f"LD_PRELOAD={self.description.ld_preload}"
-                            )
-                            copy_sbatch.write(
-                                "LD_PRELOAD=" +
-                                self.description.ld_preload + "\n"
-                            )
-
-                        written = True
-        copy_sbatch.close()
-        return copy_sbatch_path
+        sbatch_path = Path(sbatch_file).resolve()
+        stat = sbatch_path.stat()
+        head, tail = _split_sbatch(
+            str(sbatch_path), stat.st_mtime_ns, stat.st_size)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            prefix=f"{sbatch_path.stem}_",
+            suffix="_header.sbatch",
+            dir=SBATCH_TMP_DIR,
+            delete=False,
+        ) as copy_sbatch:
+            copy_sbatch.write(head)
+            if tail is not None:
+                self._write_header(copy_sbatch)
+                copy_sbatch.write(tail)
+        return copy_sbatch.name
+
+    def _write_header(self, copy_sbatch) -> None:
+        """Writes the command line, the header and the LD_PRELOAD of the
+        component, if they exist, to the sbatch being copied.
+
+        Args:
+            copy_sbatch (file): The sbatch file being written.
+        """
+        # Add the command line if exists
+        if self.cmd_line:
+            logger.info(
+                "Writing command line on top of sbatch:"
+                f"{self.cmd_line}"
+            )
+            copy_sbatch.write(self.cmd_line + "\n")
+        # Add the header at the beginning of the
+        # script if exists
+        if self.description.header:
+            logger.info(
+                "Writing header on top of sbatch"
+                f"{self.description.header}"
+            )
+            copy_sbatch.write(self.description.header + "\n")
+        # Add the ld preload at the beginning of
+        # the script if exists
+        if self.description.ld_preload:
+            logger.info(
+                "Writing LD_PRELOAD on top of sbatch:"
+                f"LD_PRELOAD={self.description.ld_preload}"
+            )
+            copy_sbatch.write(
+                "LD_PRELOAD=" + self.description.ld_preload + "\n"
+            )
 
     def _build_sbatch_cmd_line(self, sbatch_file: str, wait: bool) -> str:
         """Builds the command line to submit an sbatch_file using the HPC
@@ -217,27 +357,33 @@ class TunableComponent:
         Returns:
             str: The command line to use as a string.
         """
+        return " ".join(self._build_sbatch_cmd(sbatch_file, wait))
+
+    def _build_sbatch_cmd(self, sbatch_file: str, wait: bool) -> List[str]:
+        """Builds the arguments of the command submitting an sbatch_file
+        using the HPC component, which can be passed to subprocess without
+        being parsed again.
+
+        Args:
+            sbatch_file (str): The path to the sbatch file to run.
+            wait (bool, optional): Whether or not the process is blocking.
+                Defaults to True.
+
+        Returns:
+            list of str: The arguments of the command.
+        """
+        cmd = ["sbatch"]
         # If the wait option is enabled, use the --wait flag
-        wait_flag = ""
         if wait:
-            wait_flag = " --wait "
-
+            cmd.append("--wait")
         # If there is a plugin, add -- to the plugin
-        plugin = ""
         if self.description.plugin:
-            plugin = f" --{self.description.plugin} "
-
+            cmd.append(f"--{self.description.plugin}")
         # For variables that are cli based
-        cli_cmd = ""
-        for param, param_value in self.parameters_description.items():
-            if param_value.cli_var:
-                cli_cmd += self.build_cmd_line(param) + " "
-
-        # Build the cmd line and strip double white spaces
-        cmd_line = " ".join(
-            f"sbatch{wait_flag}{plugin} {cli_cmd} {sbatch_file}".split()
-        )
-        return cmd_line
+        for param in self._cli_params:
+            cmd.extend(self._build_cmd_arguments(param))
+        cmd.append(str(sbatch_file))
+        return cmd
 
     def submit_sbatch(self, sbatch_file: str, wait: bool = True) -> int:
         """Submits the sbatch file contained at the path sbatch_file with the
@@ -260,56 +406,58 @@ class TunableComponent:
         self.setup_var_env()
         # Transform the sbatch file
         sbatch_file = self.add_header_sbatch(sbatch_file)
-        # Build the command line for sbatch submission
-        cmd_line = self._build_sbatch_cmd_line(sbatch_file, wait)
-        # Run the script using subprocess
+        # Build the command for sbatch submission
+        cmd = self._build_sbatch_cmd(sbatch_file, wait)
+        # Run the script using subprocess, through a pseudo-terminal so that
+        # sbatch flushes the job id before the end of the job in wait mode
         master, slave = pty.openpty()
-        logger.info(f"Submitting sbatch with command line {cmd_line}")
+        logger.info(f"Submitting sbatch with command line {' '.join(cmd)}")
         sub_ps = subprocess.Popen(
-            split(cmd_line), stdout=slave, stderr=slave, env=self.var_env
+            cmd, stdout=slave, stderr=slave, env=self.var_env
         )
+        # Close the slave end on this side, so that reading the master end
+        # stops once the process is over
+        os.close(slave)
+        job_id = None
+        output = []
         with os.fdopen(master, "r") as stdout:
-            # TODO: make it less disgusting with all these iterations
-            try:
-                for ix in range(10):
-                    try:
-                        # Get job id in second line
-                        # if the submission has been a success
-                        job_id = int(stdout.readline().split()[-1])
+            while True:
+                try:
+                    line = stdout.readline()
+                # Reading a pseudo-terminal whose process is over fails
+                except OSError:
+                    break
+                if not line:
+                    break
+                # Parse the job id from the first submission message
+                if job_id is None:
+                    match = JOBID_PATTERN.search(line)
+                    if match:
+                        job_id = int(match.group(1))
                         logger.info(f"Submitted slurm job with id {job_id}")
                         self.submitted_jobids.append(job_id)
-                        break
-                    except ValueError:
-                        logger.debug(
-                            f"Parsing of jobid through stdout tentative {ix}"
-                            "failed. Retrying again."
-                        )
-                        # Try again because Slurm acts weird
-                        # with its output and skipping two lines
-                        # can do the trick
+                        self.jobid_submitted.set()
                         continue
-            # Else, raise an error
-            except (IndexError, ValueError) as err_msg:
-                raise Exception(f"Could not submit job. {err_msg}")
-
-        # Wait until the process is over to get entire stdout and stderr
+                output.append(line)
+        # Wait until the process is over
         sub_ps.wait()
-        _, output_stderr = sub_ps.communicate()
+        # The sbatch with the header has been read by sbatch upon submission
+        os.unlink(sbatch_file)
+        output = "".join(output)
+        if job_id is None:
+            raise Exception(f"Could not submit job. {output}")
         logger.debug(
             f"Return code for job submission subprocess: {sub_ps.returncode}")
-        # if sub_ps.returncode == 0:
         # If the slurm submission step is blocking (i.e. wait is enabled)
         # The sub_ps retuning a succes code means that the job was
         # successfully run
         if not sub_ps.returncode == 0:
             logger.critical(
-                f"Could not run job {job_id}: \n stderr: {output_stderr}")
+                f"Could not run job {job_id}: \n output: {output}")
             raise Exception(
-                f"Could not run job {job_id}: \n stderr: {output_stderr}")
+                f"Could not run job {job_id}: \n output: {output}")
         if wait:
             logger.info(f"Successfully ran jobid {job_id}")
-        # Close the stdout file descriptor
-        os.close(slave)
         return job_id
 
     def sanitize_parameters(self, parameters: dict) -> dict:
@@ -321,7 +469,8 @@ class TunableComponent:
              parameters (dict or OrderedDict): The raw parameters.
 
         Returns:
-            dict: the dictionary of the parameters, the keys as uppercase.
+            dict: the dictionary of the parameters, completed with the default
+                values and cast using the description file.
         """
         # Check that the given parameters are a dict or an OrderedDict.
         if (not isinstance(parameters, dict)) and (
@@ -362,11 +511,16 @@ class TunableComponent:
 
         For each of the variable in the configuration file with a flag
         env_var set to True, matches the environment variable with the
-        corresponding parameter.
+        corresponding parameter. As the parameters do not change once
+        sanitized, the environment is only setup once.
         """
-        # Iterate over each parameter
-        for param, param_value in self.parameters_description.items():
-            if param_value.env_var and self.parameters.get(param):
-                self.var_env[param] = self.parameters[param]
-        # Make sure the environment variables are all strings:
-        self.var_env = {k: str(v) for k, v in self.var_env.items()}
+        # Nothing to setup if there are no environment variables
+        if self._var_env_ready or not self._env_params:
+            return
+        if self.var_env is None:
+            self.var_env = os.environ.copy()
+        # Iterate over each parameter set as environment variable
+        # and make sure the environment variables are all strings
+        for param in self._env_params:
+            self.var_env[param] = str(self.parameters[param])
+        self._var_env_ready = True
@@ -2,8 +2,16 @@
 This module contains functions to perform the parsing of output files
 and returns an execution time.
 """
+import os
 import re
 from pathlib import Path
+from typing import Optional
+
+# The format of the times printed by the time command
+TIME_PATTERN = re.compile(r"(\d+)m(\d+)\.(\d+)s")
+
+# The number of bytes read at the end of the slurm output to find the time
+TAIL_SIZE = 4096
 
 
 def parse_milliseconds(string_time: str) -> float:
@@ -16,19 +24,43 @@ def parse_milliseconds(string_time: str) -> float:
         Returns:
             The number of elapsed seconds
         """
-    minutes = int(string_time.split("m")[0])
-    string_time = string_time.replace(str(minutes) + "m", "")
-    seconds = int(string_time.split(".")[0])
-    milliseconds_string = string_time.split(".")[1]
-    milliseconds_string = milliseconds_string.replace("s", "")
-    milliseconds = int(milliseconds_string)
+    match = TIME_PATTERN.match(string_time)
+    if not match:
+        raise ValueError(f"Could not parse time {string_time}.")
+    minutes, seconds, milliseconds = map(int, match.groups())
     return minutes * 60 + seconds + milliseconds / 1000
 
 
-def parse_slurm_times(job_id: str, path: Path = Path.cwd()) -> float:
+def _parse_real_time(lines) -> Optional[float]:
+    """Returns the first non-zero time reported on a line starting with real,
+    in the order the lines are given, or None if there is none.
+
+    parse_slurm_times passes the lines starting from the end of the file, so
+    that the last time printed in the slurm output is returned.
+
+    Args:
+        lines (iterable of str): The lines to parse, in the order in which
+            they are searched.
+
+    Returns:
+        float: The time elapsed by the application, in milliseconds.
+    """
+    for line in lines:
+        if line.startswith("real"):
+            real_time = parse_milliseconds(line.rpartition("\t")[2].strip())
+            if real_time:
+                return real_time
+    return None
+
+
+def parse_slurm_times(job_id: str, path: Path = None) -> float:
     """Performs the parsing of the file slurm-{job_id}.out by returning
     in milliseconds the time measured by Slurm.
 
+    The time is printed at the end of the file, so only the last bytes of
+    the file are parsed, starting from the end, and the whole file is only
+    read when the time can't be found there.
+
     Args:
         out_file (str): The job slurm output file path to parse.
         path (Path): The path where to look for the slurm output.
@@ -37,20 +69,28 @@ def parse_slurm_times(job_id: str, path: Path = Path.cwd()) -> float:
     Returns:
         float: The time elapsed by the application, in milliseconds.
     """
-    real_time = None
+    if path is None:
+        path = Path.cwd()
     out_file = path / f"slurm-{job_id}.out"
     try:
-        with open(out_file, "r") as file:
-            lines = file.readlines()
-            for line in lines:
-                if line.startswith("real"):
-                    time = re.split("\t", line)[-1].strip()
-                    real_time = parse_milliseconds(time)
-                    if real_time:
-                        return real_time
+        with open(out_file, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            file.seek(max(0, size - TAIL_SIZE))
+            lines = file.read().decode(errors="replace").splitlines()
+            # The first line of the tail may be truncated
+            if size > TAIL_SIZE:
+                lines = lines[1:]
+            real_time = _parse_real_time(reversed(lines))
+            if real_time is None and size > TAIL_SIZE:
+                file.seek(0)
+                real_time = _parse_real_time(reversed(
+                    file.read().decode(errors="replace").splitlines()
+                ))
+    except FileNotFoundError:
+        raise FileNotFoundError("Slurm output was not generated.")
+    if real_time is None:
         raise ValueError(
             "Could not parse time of slurm output,"
             f"content set to {real_time} !"
         )
-    except FileNotFoundError:
-        raise FileNotFoundError("Slurm output was not generated.")
+    return real_time
@@ -4,7 +4,7 @@ generated by the OSU benchmark.
 from pathlib import Path
 
 
-def parse_osu_output(job_id: str, path: Path = Path.cwd()) -> float:
+def parse_osu_output(job_id: str, path: Path = None) -> float:
     """Performs the parsing of the file slurm-{job_id}.out by returning
     the sums of the elapsed time multiplied by the size of the messages.
 
@@ -17,6 +17,8 @@ def parse_osu_output(job_id: str, path: Path = Path.cwd()) -> float:
         float: The time elapsed by the application, in milliseconds.
     """
     elapsed_time = 0
+    if path is None:
+        path = Path.cwd()
     out_file = path / f"slurm-{job_id}.out"
     try:
         with open(out_file, "r") as file:
@@ -36,7 +38,7 @@ def parse_osu_output(job_id: str, path: Path = Path.cwd()) -> float:
         raise FileNotFoundError("Slurm output was not generated.")
 
 
-def parse_osu_output_1024(job_id: str, path: Path = Path.cwd()) -> float:
+def parse_osu_output_1024(job_id: str, path: Path = None) -> float:
     """Performs the parsing of the file slurm-{job_id}.out by returning
     the elapsed time.
 
@@ -49,6 +51,8 @@ def parse_osu_output_1024(job_id: str, path: Path = Path.cwd()) -> float:
         float: The time elapsed by the application, in milliseconds.
     """
     elapsed_time = 0
+    if path is None:
+        path = Path.cwd()
     out_file = path / f"slurm-{job_id}.out"
     try:
         with open(out_file, "r") as file:
@@ -69,7 +73,7 @@ def parse_osu_output_1024(job_id: str, path: Path = Path.cwd()) -> float:
         raise FileNotFoundError("Slurm output was not generated.")
 
 
-def parse_osu_output_8(job_id: str, path: Path = Path.cwd()) -> float:
+def parse_osu_output_8(job_id: str, path: Path = None) -> float:
     """Performs the parsing of the file slurm-{job_id}.out by returning
     the elapsed time.
 
@@ -82,6 +86,8 @@ def parse_osu_output_8(job_id: str, path: Path = Path.cwd()) -> float:
         float: The time elapsed by the application, in milliseconds.
     """
     elapsed_time = 0
+    if path is None:
+        path = Path.cwd()
     out_file = path / f"slurm-{job_id}.out"
     try:
         with open(out_file, "r") as file:
@@ -102,7 +108,7 @@ def parse_osu_output_8(job_id: str, path: Path = Path.cwd()) -> float:
         raise FileNotFoundError("Slurm output was not generated.")
 
 
-def parse_osu_output_1048576(job_id: str, path: Path = Path.cwd()) -> float:
+def parse_osu_output_1048576(job_id: str, path: Path = None) -> float:
     """Performs the parsing of the file slurm-{job_id}.out by returning
     the elapsed time.
 
@@ -115,6 +121,8 @@ def parse_osu_output_1048576(job_id: str, path: Path = Path.cwd()) -> float:
         float: The time elapsed by the application, in milliseconds.
     """
     elapsed_time = 0
+    if path is None:
+        path = Path.cwd()
     out_file = path / f"slurm-{job_id}.out"
     try:
         with open(out_file, "r") as file:
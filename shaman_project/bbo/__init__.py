@@ -1,4 +1,19 @@
 # Copyright 2020 BULL SAS All rights reserved
-from bbo.optimizer import BBOptimizer
+import sys
 
 __all__ = ["BBOptimizer"]
+
+# The optimizer imports every heuristic along with their dependencies, so it
+# is only imported on first access, to keep the import of the subpackages
+# cheap (module __getattr__ requires Python 3.7)
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name == "BBOptimizer":
+            from bbo.optimizer import BBOptimizer
+
+            return BBOptimizer
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+else:
+    from bbo.optimizer import BBOptimizer
@@ -8,15 +8,49 @@ The provided methods in this module are:
     - A random restart, which restarts the system randomly
     - A threshold restart, which restarts the system once it has gone under
     a certain threshold.
+
+As these functions are called at each iteration of the simulated annealing,
+they do not check their arguments: check_restart_parameters must be used to
+validate them once beforehand.
 """
 
 # Ignore unused argument kwargs
 # pylint: disable=unused-argument
 
-import numpy as np
+import random
+
+
+def check_restart_parameters(
+    bernouilli_parameter=None, probability_threshold=None, **kwargs
+):
+    """Checks that the parameters of the restart functions are located
+    between 0 and 1, if they are specified.
+
+    Args:
+        bernouilli_parameter (float): The parameter of the random restart.
+        probability_threshold (float): The threshold of the threshold
+            restart.
 
+    Raises:
+        ValueError: if one of the parameters is not located between 0 and 1.
+    """
+    if bernouilli_parameter is not None and not (
+        0 <= bernouilli_parameter <= 1
+    ):
+        raise ValueError(
+            "Bernouilli's law parameter must be located between 0 and 1."
+        )
+    if probability_threshold is not None and not (
+        0 <= probability_threshold <= 1
+    ):
+        raise ValueError(
+            "Probability threshold should be located between 0 and 1."
+        )
 
-def random_restart(bernouilli_parameter, initial_temperature, **kwargs):
+
+def random_restart(
+    bernouilli_parameter, initial_temperature, rng=random, **kwargs
+):
     """Randomly restarts the system by drawing a Bernouilli parameter in order
     to return a Boolean. Returns the system maximal temperature as this type of
     restart restarts the system completely.
@@ -24,16 +58,15 @@ def random_restart(bernouilli_parameter, initial_temperature, **kwargs):
     Args:
         bernouilli_parameter (float): A float located between 0 and 1.
         initial_temperature (float): The system's maximal temperature.
+        rng (random.Random): The random number generator to draw from.
+            Defaults to the global generator of the random module.
 
     Returns:
         tuple of bool and float: Whether or not the system should restart and
         the system's maximal temperature.
     """
-    assert 0 <= bernouilli_parameter <= 1, (
-        "Bernouilli's law parameter must be located between 0 " "and 1."
-    )
-    flag = np.random.binomial(1, bernouilli_parameter)
-    return flag == 1, initial_temperature
+    # Comparing a single uniform draw to the parameter is a Bernouilli draw
+    return rng.random() < bernouilli_parameter, initial_temperature
 
 
 def threshold_restart(
@@ -55,7 +88,4 @@ def threshold_restart(
         tuple of bool and float: Whether or not the system should restart
             and the system's maximal temperature.
     """
-    assert 0 <= probability_threshold <= 1, (
-        "Probability threshold should be located between 0 " "and 1."
-    )
     return current_probability < probability_threshold, initial_temperature
@@ -28,6 +28,9 @@ import numpy as np
 from numpy.random import uniform
 
 from bbo.heuristics.heuristics import Heuristic
+from bbo.heuristics.simulated_annealing.restart_functions import (
+    check_restart_parameters,
+)
 
 
 class SimulatedAnnealing(Heuristic):
@@ -124,6 +127,8 @@ class SimulatedAnnealing(Heuristic):
             self.max_restart = max_restart
             # store the method used for restart
             self.restart_function = restart
+            # check the restart parameters once and for all
+            check_restart_parameters(**kwargs)
         else:
             # signal to the user that all parameters will be ignored.
             print(
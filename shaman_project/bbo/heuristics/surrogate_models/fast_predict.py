@@ -0,0 +1,119 @@
+# Copyright 2020 BULL SAS All rights reserved
+"""This module contains a compiled prediction path for surrogate models based
+on decision trees. When the numba package is available, the scaling of the
+data points and the traversal of the tree are fused into a single compiled
+function, which removes the Python overhead of the prediction when the
+acquisition strategy evaluates many data points.
+
+If numba is not installed, build_tree_predictor returns None and the
+surrogate model falls back on the predict method of the regression model.
+"""
+
+import functools
+
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+
+def scale_and_predict_tree(
+    X, mean, scale, feature, threshold, children_left, children_right, value
+):
+    """Scales the data points and predicts their value by traversing the
+    decision tree described by the arrays of its nodes.
+
+    Args:
+        X (np.array): The data points, one per row.
+        mean (np.array): The mean used for scaling each feature.
+        scale (np.array): The scale used for scaling each feature.
+        feature (np.array): The feature used to split each node.
+        threshold (np.array): The threshold used to split each node.
+        children_left (np.array): The left child of each node, -1 for
+            the leaves.
+        children_right (np.array): The right child of each node.
+        value (np.array): The predicted value of each node.
+
+    Returns:
+        np.array: The predicted value of each data point.
+    """
+    n_samples = X.shape[0]
+    predictions = np.empty(n_samples)
+    for i in range(n_samples):
+        node = 0
+        while children_left[node] != -1:
+            # sklearn compares the features as float32 values
+            scaled = np.float32(
+                (X[i, feature[node]] - mean[feature[node]])
+                / scale[feature[node]]
+            )
+            if scaled <= threshold[node]:
+                node = children_left[node]
+            else:
+                node = children_right[node]
+        predictions[i] = value[node]
+    return predictions
+
+
+@functools.lru_cache(maxsize=None)
+def compile_tree_predictor():
+    """Compiles scale_and_predict_tree with numba, which is imported on first
+    use only as its import is slow.
+
+    Returns:
+        function or None: The compiled function, or None if numba is not
+            installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(scale_and_predict_tree)
+
+
+def build_tree_predictor(regression_model, mean, scale):
+    """Builds a compiled function which scales the data points and predicts
+    their value with a fitted decision tree.
+
+    Only plain sklearn DecisionTreeRegressor with a single output are
+    supported, as subclasses can override the predict method.
+
+    Args:
+        regression_model (object): The fitted regression model.
+        mean (np.array): The mean used for scaling each feature.
+        scale (np.array): The scale used for scaling each feature.
+
+    Returns:
+        function or None: A function taking a 2D array of data points and
+            returning their predicted values, or None if numba is not
+            available or the model is not supported.
+    """
+    if type(regression_model) is not DecisionTreeRegressor:
+        return None
+    compiled_predictor = compile_tree_predictor()
+    if compiled_predictor is None:
+        return None
+    tree = regression_model.tree_
+    if tree.n_outputs != 1:
+        return None
+    # Extract the flat arrays describing the tree once
+    feature = np.ascontiguousarray(tree.feature, dtype=np.int64)
+    threshold = np.ascontiguousarray(tree.threshold, dtype=np.float64)
+    children_left = np.ascontiguousarray(tree.children_left, dtype=np.int64)
+    children_right = np.ascontiguousarray(
+        tree.children_right, dtype=np.int64)
+    value = np.ascontiguousarray(tree.value[:, 0, 0], dtype=np.float64)
+    mean = np.ascontiguousarray(mean, dtype=np.float64)
+    scale = np.ascontiguousarray(scale, dtype=np.float64)
+
+    def tree_predictor(parameters_array):
+        return compiled_predictor(
+            np.ascontiguousarray(parameters_array, dtype=np.float64),
+            mean,
+            scale,
+            feature,
+            threshold,
+            children_left,
+            children_right,
+            value,
+        )
+
+    return tree_predictor
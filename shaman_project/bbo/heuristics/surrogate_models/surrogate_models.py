@@ -3,9 +3,12 @@
 optimization of a function."""
 
 # Ignore unused argument kwargs
+import functools
+
 import numpy as np
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from bbo.heuristics.heuristics import Heuristic
+from bbo.heuristics.surrogate_models.fast_predict import build_tree_predictor
 
 
 class SurrogateModel(Heuristic):
@@ -60,11 +63,30 @@ class SurrogateModel(Heuristic):
         self.hot_encoder = None
         self.categorical_variables = None
         self.categorical_ranges = None
+        # scaled fitness of the last fit of the regression model
+        self.scaled_fitness = None
+        # mean and scale of the parameter scaler after the last fit
+        self.parameter_mean = None
+        self.parameter_scale = None
+        # compiled prediction function of the last fitted model, if any
+        self.fast_predictor = None
+        # buffer holding the scaled parameters, grown on demand
+        self._scaled_parameters_buffer = None
+        # score of the last fitted model and the history it was computed on
+        self._last_score = None
+        self._last_scored_history = None
 
     def _build_prediction_function(self):
         """Given a fitted regression model, returns a function that predicts
         the value at data point x for this model.
 
+        As the acquisition strategies can query the same data point several
+        times, the predictions of single data points are memoized on their
+        content and the keyword arguments. Batches of data points, such as
+        the whole grid, are predicted directly. The memoization is tied to
+        the returned function, so that it is dropped each time the model is
+        fitted again.
+
         Args:
             fitted_regression_model (object of class regression_model):
                 A fitted object of class regression_model
@@ -72,22 +94,63 @@ class SurrogateModel(Heuristic):
         Returns:
             function: The function that can be used to predict the value of x.
         """
+        @functools.lru_cache(maxsize=4096)
+        def cached_prediction(key_bytes, shape, kwargs_items):
+            x_arr = np.frombuffer(key_bytes).reshape(shape)
+            return predict(x_arr, **dict(kwargs_items))
+
+        def predict(x_arr, *args, **kwargs):
+            # A single data point is predicted as a batch of one
+            if x_arr.ndim == 1:
+                x_arr = x_arr.reshape(1, -1)
+            return self._predict_encoded(x_arr, *args, **kwargs)
+
         # define the function
         def prediction_function(data_point, *args, **kwargs):
-            x_arr = self.hot_encode(data_point)
+            x_arr = np.ascontiguousarray(
+                self.hot_encode(data_point), dtype=np.float64)
+            # Only single data points without positional arguments are
+            # memoized
+            if args or (x_arr.ndim > 1 and x_arr.shape[0] > 1):
+                return predict(x_arr, *args, **kwargs)
+            kwargs_items = tuple(sorted(kwargs.items()))
             try:
-                scaled_arr = self.parameter_scaler.transform(x_arr)
-                return self.regression_model.predict(
-                    scaled_arr, *args, **kwargs)
-            except ValueError:
-                scaled_arr = self.parameter_scaler.transform(
-                    x_arr.reshape(1, -1))
-                return self.regression_model.predict(
-                    scaled_arr, *args, **kwargs)
+                hash(kwargs_items)
+            except TypeError:
+                # Unhashable keyword arguments can't be memoized
+                return predict(x_arr, **kwargs)
+            prediction = cached_prediction(
+                x_arr.tobytes(), x_arr.shape, kwargs_items)
+            # Return copies, so that the memoized values can't be modified
+            # by the caller
+            if isinstance(prediction, tuple):
+                return tuple(np.copy(value) for value in prediction)
+            return np.copy(prediction)
 
         # return it
         return prediction_function
 
+    def _predict_encoded(self, parameters_array, *args, **kwargs):
+        """Scales an already hot encoded 2D array of parameters and predicts
+        the values of the fitted regression model on it in a single call.
+
+        Args:
+            parameters_array (np.array): the hot encoded parameters, one
+                parametrization per row.
+
+        Returns:
+            np.array: the predicted values.
+        """
+        # Use the compiled path of tree based models when available
+        if self.fast_predictor is not None and not args and not kwargs:
+            return self.fast_predictor(parameters_array)
+        # Scale using the fitted statistics directly, which skips the input
+        # validation of the scaler's transform method
+        parameters_array = np.asarray(parameters_array, dtype=np.float64)
+        scaled_arr = \
+            (parameters_array - self.parameter_mean) / self.parameter_scale
+        return self.regression_model.predict(scaled_arr, *args, **kwargs)
+
     def get_categorical_ranges(self, ranges):
         """Compute the categorical ranges of an array.
 
@@ -145,6 +208,26 @@ class SurrogateModel(Heuristic):
                               hot_encoded])
         return parameters_array
 
+    def _get_scaled_parameters_buffer(self, shape):
+        """Returns a view of the buffer used to store the scaled parameters,
+        with the given shape. The buffer is only reallocated when the number
+        of features changes or when it is too small, in which case its
+        capacity is doubled.
+
+        Args:
+            shape (tuple): the shape of the parameters array to scale.
+
+        Returns:
+            np.array: a view of the buffer with the given shape.
+        """
+        n_rows, n_features = shape
+        buffer = self._scaled_parameters_buffer
+        if buffer is None or buffer.shape[1] != n_features \
+                or buffer.shape[0] < n_rows:
+            buffer = np.empty((max(2 * n_rows, 64), n_features))
+            self._scaled_parameters_buffer = buffer
+        return buffer[:n_rows]
+
     def regression_function(self, history, ranges):
         """Fits the regression or interpolation method on the history of the
         previous evaluations and returns the associated prediction function.
@@ -165,12 +248,34 @@ class SurrogateModel(Heuristic):
         # take parameter array and transform it using the hot encoder
         parameters_array = self.hot_encode(history["parameters"])
         # take history and normalize it using standard scaler
-        scaled_parameters = self.parameter_scaler.fit_transform(
-            parameters_array)
-        scaled_fitness = self.fitness_scaler.fit_transform(
-            history["fitness"].reshape(-1, 1)
-        )
-        truncated = np.copy(history["truncated"])
+        # the scalers are fitted on the whole history rather than updated
+        # with partial_fit, as the history is not append-only: the fitness
+        # aggregation merges the rows of a same parametrization, sorts them
+        # and changes their fitness when they are resampled
+        parameters_array = np.ascontiguousarray(
+            parameters_array, dtype=np.float64)
+        self.parameter_scaler.fit(parameters_array)
+        # save the statistics of the parameter scaler for the predictions
+        self.parameter_mean = self.parameter_scaler.mean_
+        self.parameter_scale = self.parameter_scaler.scale_
+        # scale the parameters into a buffer reused across the iterations
+        scaled_parameters = self._get_scaled_parameters_buffer(
+            parameters_array.shape)
+        np.subtract(parameters_array, self.parameter_mean,
+                    out=scaled_parameters)
+        np.divide(scaled_parameters, self.parameter_scale,
+                  out=scaled_parameters)
+        # the scaler expects the fitness as a contiguous float column
+        fitness = np.ascontiguousarray(history["fitness"], dtype=np.float64)
+        if fitness.ndim != 2:
+            fitness = fitness.reshape(-1, 1)
+        scaled_fitness = self.fitness_scaler.fit_transform(fitness)
+        # save the scaled fitness, used as previous evaluations when
+        # choosing the next parameter (copied as the censored regression
+        # models replace the censored values in place when fitting)
+        self.scaled_fitness = scaled_fitness.copy()
+        # the regression models only read the truncation flags
+        truncated = np.asarray(history["truncated"])
         # perform regression and save resulting function as attribute
         # try to pass the truncated argument in order to deal with censored
         # data
@@ -181,6 +286,12 @@ class SurrogateModel(Heuristic):
         # if not, fit the model without this parameter
         except TypeError:
             self.regression_model.fit(X=scaled_parameters, y=scaled_fitness)
+        self.fast_predictor = build_tree_predictor(
+            self.regression_model, self.parameter_mean, self.parameter_scale
+        )
+        # the score of the previous model is no longer valid
+        self._last_score = None
+        self._last_scored_history = None
         return self._build_prediction_function()
 
     def choose_next_parameter(self, history, ranges, *args, **kwargs):
@@ -204,9 +315,7 @@ class SurrogateModel(Heuristic):
         new_parameter = self.next_parameter_strategy(
             prediction_function,
             ranges=ranges,
-            previous_evaluations=self.fitness_scaler.transform(
-                history["fitness"].reshape(-1, 1)
-            ),
+            previous_evaluations=self.scaled_fitness,
         )
         return new_parameter
 
@@ -215,6 +324,9 @@ class SurrogateModel(Heuristic):
         of the regression function on the already evaluated points. The model
         must have been already fitted in order to return a score.
 
+        The score is kept until the model is fitted again, so that evaluating
+        the same history several times only predicts it once.
+
         Args:
             history (dict): the history of the optimization, i.e. the tested
                 parameters and the associated value.
@@ -222,9 +334,16 @@ class SurrogateModel(Heuristic):
         Returns:
             RMSE (float): The value of the RMSE on the evaluated data points.
         """
-        return self.regression_model.score(
-            X=history["parameters"], y=history["fitness"]
-        )
+        scored_history = (history["parameters"], history["fitness"])
+        if self._last_scored_history is None or any(
+            new is not last
+            for new, last in zip(scored_history, self._last_scored_history)
+        ):
+            self._last_score = self.regression_model.score(
+                X=history["parameters"], y=history["fitness"]
+            )
+            self._last_scored_history = scored_history
+        return self._last_score
 
     def summary(self, history):
         """Returns a summary of the optimization process of the surrogate
@@ -17,7 +17,7 @@ dictionary and the available initialization in __initial_parametrization__.
 """
 
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 import numpy as np
 from loguru import logger
 
@@ -517,7 +517,8 @@ class BBOptimizer:
             else:
                 cost = time.time() - start_time
             if cost < max_step_cost:
-                time.sleep(0.1)
+                # Wait for the result, checking the cost again every 0.1s
+                wait([computing_thread], timeout=0.1)
             else:
                 # End the process
                 computing_thread.cancel()
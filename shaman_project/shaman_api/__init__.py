@@ -3,7 +3,26 @@
 
 Rest API written in Python using FastAPI framework
 """
-from .app import app
+import sys
+
 from .cli import cli
 
 __all__ = ["app", "cli"]
+
+# The application imports the routers along with the database drivers, so it
+# is only imported on first access, to keep the startup of the command line
+# cheap (module __getattr__ requires Python 3.7)
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name == "app":
+            from .app import app
+
+            # Importing the submodule binds its name on the package, so it
+            # must be replaced with the application itself
+            globals()["app"] = app
+            return app
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+else:
+    from .app import app
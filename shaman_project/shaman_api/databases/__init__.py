@@ -4,6 +4,6 @@
 This subpackages defines connections to mongodb databases and functions
 to interact with databases
 """
-from .shaman import ExperimentDatabase
+from .shaman import ExperimentDatabase, EXPERIMENT_DATABASE
 
-__all__ = ["ExperimentDatabase"]
+__all__ = ["ExperimentDatabase", "EXPERIMENT_DATABASE"]
@@ -28,6 +28,9 @@ class ExperimentDatabase:
         self.server_info: Optional[dict] = None
 
     async def connect(self, config: DatabaseConfig = None):
+        # The database is shared by the routers, connect only once
+        if self.async_client is not None:
+            return self
         # Parse config from environment if not provided
         if config is None:
             config = DatabaseConfig()
@@ -52,7 +55,10 @@ class ExperimentDatabase:
         return self
 
     async def close(self):
+        if self.async_client is None:
+            return
         self.async_client.close()
+        self.async_client = None
         logger.info("Closed connection to mongodb server.")
 
     async def create_experiment(self, experiment: InitExperiment):
@@ -219,3 +225,8 @@ class ExperimentDatabase:
             }
         else:
             {"": []}
+
+
+# The database is shared by all the routers of the application, so that
+# they use the same pool of connections
+EXPERIMENT_DATABASE = ExperimentDatabase()
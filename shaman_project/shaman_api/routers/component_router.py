@@ -1,14 +1,14 @@
 # Copyright 2020 BULL SAS All rights reserved
 from typing import Any, Callable, get_type_hints
 from fastapi import APIRouter
-from ..databases.shaman import ExperimentDatabase
+from ..databases.shaman import EXPERIMENT_DATABASE
 
 
 class ComponentRouter(APIRouter):
     """Router that will contain the endpoints relative to the components."""
 
     def __init__(self, *args, **kwargs):
-        db = ExperimentDatabase()
+        db = EXPERIMENT_DATABASE
         self.db = db
         on_startup = set(kwargs.get("on_startup", []))
         on_startup.add(db.connect)
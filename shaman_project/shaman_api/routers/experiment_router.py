@@ -4,14 +4,14 @@ from fastapi import APIRouter
 from loguru import logger
 from arq import create_pool
 from arq.connections import RedisSettings, ArqRedis
-from ..databases.shaman import ExperimentDatabase
+from ..databases.shaman import EXPERIMENT_DATABASE
 
 from shaman_core.config import RedisConfig
 
 
 class ExperimentRouter(APIRouter):
     def __init__(self, *args, **kwargs):
-        db = ExperimentDatabase()
+        db = EXPERIMENT_DATABASE
         self.db = db
         self.redis: Optional[ArqRedis] = None
         on_startup = set(kwargs.get("on_startup", []))
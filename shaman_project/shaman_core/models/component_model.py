@@ -1,6 +1,7 @@
 # Copyright 2020 BULL SAS All rights reserved
 """Defines a pydantic model that represents a tunable component."""
 from pathlib import Path
+import functools
 import importlib
 from typing import Dict, Optional, Any
 import builtins
@@ -8,6 +9,28 @@ import httpx
 from pydantic import BaseModel, root_validator
 import yaml
 
+# Use the libyaml bindings when they are available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml(cls, path: str, mtime_ns: int, size: int):
+    """Loads the configuration of class cls from the YAML file located at
+    path.
+
+    The results are memoized on the class, the resolved path, the
+    modification time and the size of the file, so that a configuration is
+    only loaded once per process as long as the file is left untouched.
+
+    Args:
+        cls (type): The class of the configuration to build.
+        path (str): The resolved path to the YAML file.
+        mtime_ns (int): The modification time of the YAML file, in
+            nanoseconds.
+        size (int): The size of the YAML file, in bytes.
+    """
+    return cls(**yaml.load(Path(path).read_text(), Loader=YAML_LOADER))
+
 
 class BaseConfiguration:
     """Base class to load YAML."""
@@ -16,10 +39,16 @@ class BaseConfiguration:
     def from_yaml(cls, path: str):
         """Loads the yaml file located at the path path.
 
+        Within a process, the model is kept in memory and shared between the
+        callers as long as the file is left untouched: it must be treated as
+        read-only.
+
         Args:
             path (str): The path to the YAML file.
         """
-        return cls(**yaml.load(Path(path).read_text(), Loader=yaml.SafeLoader))
+        path = Path(path).resolve()
+        stat = path.stat()
+        return _load_yaml(cls, str(path), stat.st_mtime_ns, stat.st_size)
 
     @classmethod
     def from_api(cls, url: str):
@@ -14,6 +14,8 @@ import numpy as np
 from loguru import logger
 import yaml
 
+from shaman_core.models.component_model import YAML_LOADER
+
 
 class BaseConfiguration:
     """Base class to load YAML."""
@@ -22,7 +24,7 @@ class BaseConfiguration:
     def from_yaml(cls, path, component_name):
         """Loads the yaml file located at the path path."""
         return cls(
-            **yaml.load(Path(path).read_text(), Loader=yaml.SafeLoader),
+            **yaml.load(Path(path).read_text(), Loader=YAML_LOADER),
             component_name=component_name,
         )
 
@@ -31,6 +33,7 @@ class ExperimentParameters(BaseModel):
     """Contains the experiment parameters."""
 
     default_first: bool = True
+    cache_repeats: bool = False
 
 
 class PruningParameters(BaseModel):
@@ -97,7 +100,7 @@ class ParameterRange(BaseModel):
         if self.step_type == "additive":
             return np.arange(self.min, self.max + 1, self.step)
         elif self.step_type == "multiplicative":
-            range_ = list()
+            range_ = []
             val_ = self.min
             while val_ <= self.max:
                 range_.append(val_)
@@ -129,13 +132,18 @@ class SHAManConfig(BaseConfiguration):
             self.component_parameters = self.components[self.component_name]
         except KeyError:
             raise KeyError(f"Invalid component name {self.component_name}")
+        if self.experiment.cache_repeats and self.noise_reduction:
+            raise ValueError(
+                "The target values can't be reused when the "
+                "parametrizations are resampled to reduce the noise."
+            )
 
     @property
     def bbo_parameters(self) -> Dict:
         """Parses the bbo parameters to make them suitable to pass as argument
         of the BBOptimizer."""
-        bbo_kwargs = dict()
-        bbo_parameters = self.bbo
+        bbo_kwargs = {}
+        bbo_parameters = dict(self.bbo)
         if self.noise_reduction:
             bbo_parameters.update(self.noise_reduction)
         for param, value in bbo_parameters.items():
@@ -164,7 +172,7 @@ class SHAManConfig(BaseConfiguration):
         """Returns the range of the parameters, and takes into account
         whether the specified component range is a list or a parameter
         range."""
-        array_parameters = list()
+        array_parameters = []
         for parameter_range in self.component_parameters.values():
             # Check if the parameter_range has been specified as a
             # ParameterRange (min, max step)
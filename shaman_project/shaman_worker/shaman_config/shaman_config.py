@@ -5,6 +5,10 @@ from typing import Dict
 import yaml
 from pathlib import Path
 
+# Use the libyaml bindings when they are available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class SHAManConfigBuilder:
     """Class to build a shaman configuration file from the data sent by the
@@ -45,7 +49,7 @@ class SHAManConfigBuilder:
         """
         # Open the default_file and store it as a config attribute
         with open(default_file, "r") as stream:
-            self.config = yaml.safe_load(stream)
+            self.config = yaml.load(stream, Loader=YAML_LOADER)
         # Save the path to the output file as attribute
         self.output_file = output_file
 
@@ -154,5 +158,5 @@ class SHAManConfigBuilder:
         """Save the configuration file in the location indicated by the
         attribute output file."""
         with open(self.output_file, "w") as configfile:
-            yaml.dump(self.config, configfile)
+            yaml.dump(self.config, configfile, Dumper=YAML_DUMPER)
             print(f"Dumped configuration file at {self.output_file}")
@@ -7,8 +7,9 @@ The goal of this module is to provide integration test of the little-shaman comm
 This test requires:
     - The Slurm workload manager
 """
-import unittest
+import pytest
 import os
+import shutil
 import subprocess
 from shlex import split
 
@@ -16,7 +17,6 @@ CURRENT_DIR = os.getcwd()
 FILE_DIR = os.path.dirname(os.path.realpath(__file__))
 TEST_DATA = os.path.join(FILE_DIR, "test_data")
 CONFIG_ASYNC_DEFAULT = os.path.join(TEST_DATA, "config_shaman_async_default.cfg")
-CONFIG_ASYNC_STEP = os.path.join(TEST_DATA, "config_shaman_async_default.cfg")
 CONFIG_ASYNC_MEDIAN = os.path.join(TEST_DATA, "config_shaman_async_median.cfg")
 TEST_SBATCH = os.path.join(TEST_DATA, "test_sbatch.sbatch")
 
@@ -24,64 +24,23 @@ TEST_SBATCH = os.path.join(TEST_DATA, "test_sbatch.sbatch")
 # TODO: update tests
 
 
-class TestAsyncOptimization(unittest.TestCase):
-    """
-    Unittests for testing that the optimization runs properly in an asynchronous setting.
-    """
-
-    def setUp(self):
-        """
-        Setup the test by writing down the little-shaman command line.
-        """
-        self.cmd_default = (
-            f"little-shaman --accelerator_name fiol --nbr_iteration 1 --sbatch_file "
-            f"{TEST_SBATCH} --configuration_file {CONFIG_ASYNC_DEFAULT} --experiment_name test"
-        )
-        self.cmd_step = (
-            f"little-shaman --accelerator_name fiol --nbr_iteration 1 --sbatch_file "
-            f"{TEST_SBATCH} --configuration_file {CONFIG_ASYNC_STEP} --experiment_name test"
-        )
-        self.cmd_median = (
-            f"little-shaman --accelerator_name fiol --nbr_iteration 1 --sbatch_file "
-            f"{TEST_SBATCH} --configuration_file {CONFIG_ASYNC_MEDIAN} --experiment_name test"
-        )
-
-    def test_run_command_default(self):
-        """
-        Run the little-shaman command in a subprocess.
-        """
-        sub_ps = subprocess.run(
-            split(self.cmd_default), stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        output_stdout = sub_ps.stdout.decode()
-        output_stderr = sub_ps.stderr.decode()
-        print(output_stdout)
-        print(output_stderr)
+pytestmark = [
+    pytest.mark.slurm,
+    pytest.mark.skipif(shutil.which("sbatch") is None, reason="Slurm is not available"),
+]
 
-    def test_run_command_step(self):
-        """
-        Run the little-shaman command in a subprocess.
-        """
-        sub_ps = subprocess.run(
-            split(self.cmd_step), stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        output_stdout = sub_ps.stdout.decode()
-        output_stderr = sub_ps.stderr.decode()
-        print(output_stdout)
-        print(output_stderr)
 
-    def test_run_command_median(self):
-        """
-        Run the little-shaman command in a subprocess.
-        """
-        sub_ps = subprocess.run(
-            split(self.cmd_median), stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        output_stdout = sub_ps.stdout.decode()
-        output_stderr = sub_ps.stderr.decode()
-        print(output_stdout)
-        print(output_stderr)
-
-
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
+@pytest.mark.parametrize("configuration_file", [CONFIG_ASYNC_DEFAULT, CONFIG_ASYNC_MEDIAN])
+def test_run_command(configuration_file):
+    """
+    Run the little-shaman command in a subprocess, for the given configuration file.
+    """
+    cmd = (
+        f"little-shaman --accelerator_name fiol --nbr_iteration 1 --sbatch_file "
+        f"{TEST_SBATCH} --configuration_file {configuration_file} --experiment_name test"
+    )
+    sub_ps = subprocess.run(split(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output_stdout = sub_ps.stdout.decode()
+    output_stderr = sub_ps.stderr.decode()
+    print(output_stdout)
+    print(output_stderr)
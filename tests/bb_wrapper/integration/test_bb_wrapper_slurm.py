@@ -7,14 +7,21 @@ This test requires:
 """
 
 import unittest
+import pytest
 import os
 import glob
+import shutil
 import time
 from shlex import split
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from bb_wrapper.bb_wrapper import BBWrapper
+
+# Skip before importing the package when Slurm is not available
+if shutil.which("sbatch") is None:
+    pytest.skip("Slurm is not available", allow_module_level=True)
+
+from bb_wrapper.bb_wrapper import BBWrapper  # noqa: E402
 
 
 TEST_SBATCH = Path(__file__).parent / "test_sbatch" / "test_sbatch.sbatch"
@@ -22,6 +29,10 @@ TEST_SBATCH_SLEEP = Path(__file__).parent / "test_sbatch" / "test_sbatch_sleep.s
 TEST_CONFIG = Path(__file__).parent / "test_config" / "component_config.yaml"
 
 
+# These tests share the files written in the working directory
+pytestmark = [pytest.mark.slurm, pytest.mark.xdist_group("bb_wrapper_slurm")]
+
+
 # Helper functions for testing
 def string_in_output(command, string):
     """This function checks if a string is located in the output of a bash command.
@@ -32,9 +43,9 @@ def string_in_output(command, string):
         A boolean which indicates if the string is located in the output of the bash command.
     """
     cmd = split(command)
-    sub_ps = subprocess.run(cmd, stdout=subprocess.PIPE, shell=False)
-    ps_stdout = sub_ps.stdout.decode()
-    return string in ps_stdout and sub_ps.returncode == 0
+    sub_ps = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=False)
+    return sub_ps.returncode == 0 and string.encode() in sub_ps.stdout
 
 
 def check_slurm_queue_name(job_name):
@@ -42,6 +53,8 @@ def check_slurm_queue_name(job_name):
     Note that the maximum length for the squeue slurm name is set to 8
     and this function truncates the job_name if it exceeds this number of
     characters.
+    Unlike check_slurm_queue_id, it does not go through the snapshot of the
+    jobs of the user, which only holds their ids and running times.
     Args:
         job_name (str): The name of the job.
     Returns:
@@ -52,13 +65,16 @@ def check_slurm_queue_name(job_name):
 
 def check_slurm_queue_id(job_id):
     """Returns true if the job whose id is job_id is in the slurm queue.
+    The queue is read with the same single squeue call on the jobs of the
+    user as BBWrapper.parse_job_elapsed_time, but without its cache, as the
+    tests check the queue right after submitting or cancelling a job.
     Args:
         job_id (int): The ID of the job.
     Returns:
         A boolean indicating whether or not the slurm job is running.
     """
     try:
-        return string_in_output("squeue", str(int(job_id)))
+        return int(job_id) in BBWrapper.parse_squeue_elapsed_times()
     except TypeError:
         raise TypeError("Job id must be an integer.")
 
@@ -111,6 +127,8 @@ class TestBBWrapper(unittest.TestCase):
         # Check that the job elapsed time is properly returned
         self.assertGreater(self.bb_wrapper.parse_job_elapsed_time(job_id), 0)
         self.assertLess(self.bb_wrapper.parse_job_elapsed_time(job_id), 10)
+        # Cancel the job so that it does not hold the node
+        self.bb_wrapper.scancel_job(job_id)
 
     def test_compute_separate_thread(self):
         """Tests that when the compute method is ran in a separate thread, the time of the job can be
@@ -119,9 +137,9 @@ class TestBBWrapper(unittest.TestCase):
         pool = ThreadPoolExecutor()
         future = pool.submit(self.bb_wrapper.compute, (parameters))
         time.sleep(5)
-        while not future.done():
-            while not self.bb_wrapper.component.submitted_jobids:
-                time.sleep(1)
+        while not wait([future], timeout=0.1).done:
+            self.assertTrue(
+                self.bb_wrapper.component.jobid_submitted.wait(timeout=30))
             running_job_id = self.bb_wrapper.component.submitted_jobids[0]
             # Let a few seconds elapse
             time.sleep(2)
@@ -2,38 +2,57 @@
 """Tests the proper integration of slurm components within Slurm, for the submit_sbatch method.
 """
 import unittest
+import pytest
 from pathlib import Path
 import time
-from bb_wrapper.tunable_component.component import TunableComponent
+import shutil
+
+# Skip before importing the package when Slurm is not available
+if shutil.which("sbatch") is None:
+    pytest.skip("Slurm is not available", allow_module_level=True)
+
+from bb_wrapper.tunable_component.component import TunableComponent  # noqa: E402
 
 
 MODULE_CONFIGURATION = Path(__file__).parent / \
     "test_config" / "component_config.yaml"
 TEST_SBATCH = Path(__file__).parent / "test_sbatch" / "test_sbatch.sbatch"
+TEST_SBATCH_QUICK = Path(__file__).parent / \
+    "test_sbatch" / "test_sbatch_quick.sbatch"
+
+
+# These tests share the files written in the working directory
+pytestmark = [pytest.mark.slurm, pytest.mark.xdist_group("component_slurm")]
 
 
 class TestTunableComponent(unittest.TestCase):
     """Tests that component tuning works as expected when integrated with Slurm.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Creates the component once for all the tests, as none of them
+        modifies it before submission.
+        """
+        cls.tunable_component = TunableComponent(
+            "component_1", MODULE_CONFIGURATION)
+
     def test_submit_sbatch_wait(self):
         """Tests that the sbatch submission works as expected, when wait is enabled.
         """
-        tunable_component = TunableComponent(
-            "component_1", MODULE_CONFIGURATION)
         start = time.time()
-        job_id = tunable_component.submit_sbatch(TEST_SBATCH, wait=True)
+        job_id = self.tunable_component.submit_sbatch(
+            TEST_SBATCH_QUICK, wait=True)
         end = time.time()
         assert isinstance(job_id, int)
-        self.assertGreater(end - start, 10)
+        # The job sleeps for one second
+        self.assertGreater(end - start, 0.5)
 
     def test_submit_sbatch_no_wait(self):
         """Tests that the sbatch submission works as expected, when wait is not enabled.
         """
-        tunable_component = TunableComponent(
-            "component_1", MODULE_CONFIGURATION)
         start = time.time()
-        job_id = tunable_component.submit_sbatch(TEST_SBATCH, wait=False)
+        job_id = self.tunable_component.submit_sbatch(TEST_SBATCH, wait=False)
         end = time.time()
         assert isinstance(job_id, int)
         self.assertLess(end - start, 5)
@@ -7,7 +7,15 @@ from unittest.mock import patch
 
 from pathlib import Path
 from shutil import copy
+
+import pytest
+
 from bb_wrapper.bb_wrapper import BBWrapper
+from bb_wrapper.tunable_component.component import load_components
+
+# The tests write to and clean the current directory, so they must run on
+# the same worker when running in parallel
+pytestmark = pytest.mark.xdist_group("current_directory")
 
 # Test config component
 TEST_CONFIG = Path(__file__).parent / "test_config"
@@ -227,6 +235,39 @@ class TestBBWrapper(unittest.TestCase):
         self.assertListEqual(self.bb_wrapper.jobids, [42])
         self.assertEqual(time, 1508.085)
 
+    @patch("bb_wrapper.tunable_component.component.TunableComponent.submit_sbatch")
+    def test_compute_cache_repeats(self, mock_submit_sbatch):
+        """Tests that a parametrization which has already been run is not submitted again
+        when the repeats are cached.
+        """
+        mock_submit_sbatch.return_value = 42
+        copy(TEST_SLURMS / "slurm-42.out", CURRENT_DIR)
+        self.bb_wrapper.cache_repeats = True
+        self.assertEqual(self.bb_wrapper.compute([6, 9]), 1508.085)
+        self.assertEqual(self.bb_wrapper.compute([6, 9]), 1508.085)
+        mock_submit_sbatch.assert_called_once()
+        self.assertListEqual(self.bb_wrapper.jobids, [42, 42])
+        # The reused job is reported as the job of the last computation
+        self.bb_wrapper.component.submitted_jobids = [41]
+        self.assertEqual(self.bb_wrapper.current_jobid, 42)
+        self.bb_wrapper.compute([7, 8])
+        self.assertEqual(mock_submit_sbatch.call_count, 2)
+        self.bb_wrapper.component.submitted_jobids = [43]
+        self.assertEqual(self.bb_wrapper.current_jobid, 43)
+
+    @patch("bb_wrapper.bb_wrapper.load_components",
+           side_effect=load_components)
+    def test_setup_component_loads_once(self, mock_load_components):
+        """Tests that the component configuration is loaded only once when
+        setting up the component several times.
+        """
+        self.bb_wrapper.setup_component([6, 9])
+        self.bb_wrapper.setup_component([7, 8])
+        mock_load_components.assert_called_once_with(COMPONENT_CONFIG)
+        self.assertDictEqual(
+            self.bb_wrapper.component.parameters,
+            {"param_1": 7, "param_2": 8})
+
     @patch("bb_wrapper.tunable_component.component.TunableComponent.submit_sbatch")
     def test_run_default(self, mock_submit_sbatch):
         """Tests that running the default parametrization behaves as expected.
@@ -251,11 +292,21 @@ class TestBBWrapper(unittest.TestCase):
         """Tests that parsing a job elapsed time through a subprocess call calling the
         squeue command works as expected.
         """
-        mock_stdout.return_value.stdout = "'             JOBID PARTITION     NAME     USER ST       TIME  NODES NODELIST(REASON)\n                 9       all    sleep     root  R       0:30      1 compute1\n'".encode(
-        )
+        mock_stdout.return_value.stdout = "2 0:30\n9 1:02:03\n"
         time = self.bb_wrapper.parse_job_elapsed_time(2)
         self.assertEqual(30, time)
 
+    @patch("subprocess.run")
+    def test_parse_job_elapsed_time_cached(self, mock_stdout):
+        """Tests that the output of squeue is reused for the jobs polled shortly after, and
+        that the jobs which are not in the queue anymore have an elapsed time of 0.
+        """
+        mock_stdout.return_value.stdout = "2 0:30\n9 1-01:02:03\n"
+        self.assertEqual(self.bb_wrapper.parse_job_elapsed_time(2), 30)
+        self.assertEqual(self.bb_wrapper.parse_job_elapsed_time(9), 90123)
+        self.assertEqual(self.bb_wrapper.parse_job_elapsed_time(42), 0)
+        mock_stdout.assert_called_once()
+
     @patch("subprocess.run")
     def test_scancel_job(self, mock_stdout):
         """Tests that scanceling a job through a subprocess call of the scancel command works as
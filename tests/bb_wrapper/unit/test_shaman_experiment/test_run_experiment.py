@@ -8,10 +8,15 @@ import unittest
 from unittest.mock import patch
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from bb_wrapper.run_experiment import cli, run
 
+# The tests write to and clean the current directory, so they must run on
+# the same worker when running in parallel
+pytestmark = pytest.mark.xdist_group("current_directory")
+
 CONFIG = Path(__file__).parent / "test_config" / "vanilla.yaml"
 SBATCH = Path(__file__).parent / "test_sbatch" / "test_sbatch.sbatch"
 
@@ -59,6 +64,36 @@ class TestShamanExperiment(unittest.TestCase):
         assert not list(Path.cwd().glob("slurm*.out"))
         assert not list(Path.cwd().glob("*_shaman.sbatch"))
 
+    @patch("bb_wrapper.run_experiment.SHAManExperiment")
+    def test_main_cli_arguments(self, mock_experiment):
+        """Tests that the arguments of the shaman CLI are passed to the experiment, without
+        running it."""
+        args_list = [
+            "--component-name",
+            "component_1",
+            "--nbr-iteration",
+            "1",
+            "--sbatch-file",
+            str(SBATCH),
+            "--experiment-name",
+            "test_experiment",
+            "--configuration-file",
+            str(CONFIG),
+        ]
+        result = runner.invoke(cli, args_list)
+        assert result.exit_code == 0
+        mock_experiment.assert_called_once_with(
+            component_name="component_1",
+            nbr_iteration=1,
+            sbatch_file=str(SBATCH),
+            experiment_name="test_experiment",
+            sbatch_dir=None,
+            slurm_dir=None,
+            result_file=None,
+            configuration_file=str(CONFIG),
+        )
+        mock_experiment.return_value.launch.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
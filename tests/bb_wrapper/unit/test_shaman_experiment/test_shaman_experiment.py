@@ -12,11 +12,16 @@ from shutil import copy, rmtree
 from datetime import datetime
 
 import numpy as np
+import pytest
 
 from bbo.optimizer import BBOptimizer
 from bb_wrapper.bb_wrapper import BBWrapper
 from bb_wrapper.shaman_experiment import SHAManExperiment
 
+# The tests write to and clean the current directory, so they must run on
+# the same worker when running in parallel
+pytestmark = pytest.mark.xdist_group("current_directory")
+
 
 CURRENT_DIR = Path.cwd()
 
@@ -25,6 +30,8 @@ CONFIG_ASYNC_DEFAULT = Path(__file__).parent / \
     "test_config" / "pruning_default.yaml"
 CONFIG_ASYNC = Path(__file__).parent / "test_config" / "pruning.yaml"
 CONFIG_NOISE = Path(__file__).parent / "test_config" / "noise_reduction.yaml"
+CONFIG_WRONG_HEURISTIC = Path(__file__).parent / \
+    "test_config" / "wrong_heuristic.yaml"
 SBATCH = Path(__file__).parent / "test_sbatch" / "test_sbatch.sbatch"
 TEST_SLURMS = Path(__file__).parent / "test_slurm_outputs"
 SLURM_DIR = Path(__file__).resolve().parent / "slurm_save"
@@ -238,6 +245,19 @@ class TestSHAManExperiment(unittest.TestCase):
         self.assertIsInstance(se.bb_wrapper, BBWrapper)
         self.assertIsInstance(se.bb_optimizer, BBOptimizer)
 
+    @patch("httpx.get", side_effect=mocked_requests_get)
+    def test_init_optimizer_on_first_use(self, mocked_requests_get):
+        """Tests that the black box optimizer is only setup on first use, and only once."""
+        se = SHAManExperiment(
+            component_name="component_1",
+            nbr_iteration=3,
+            sbatch_file=SBATCH,
+            experiment_name="test_experiment",
+            configuration_file=CONFIG,
+        )
+        self.assertIsNone(se._bb_optimizer)
+        self.assertIs(se.bb_optimizer, se.bb_optimizer)
+
     @patch("httpx.get", side_effect=mocked_requests_get)
     def test_init_noisereduction(self, mocked_requests_get):
         """Tests the proper initialization of the class when using a noise reduction strategy."""
@@ -447,6 +467,26 @@ class TestSHAManExperiment(unittest.TestCase):
         # Remove file
         Path("test_result.out").unlink()
 
+    @patch("httpx.get", side_effect=mocked_requests_get)
+    @patch("httpx.Client.post", side_effect=mocked_requests_post)
+    @patch("bb_wrapper.bb_wrapper.BBWrapper.run_default")
+    def test_launch_wrong_configuration(
+        self, mock_default, mock_post, mocked_requests_get
+    ):
+        """Tests that an invalid optimizer configuration is rejected before the experiment is
+        created and the default run is submitted."""
+        se = SHAManExperiment(
+            component_name="component_1",
+            nbr_iteration=3,
+            sbatch_file=SBATCH,
+            experiment_name="test_experiment",
+            configuration_file=CONFIG_WRONG_HEURISTIC,
+        )
+        with self.assertRaises(ValueError):
+            se.launch()
+        mock_post.assert_not_called()
+        mock_default.assert_not_called()
+
 #     @patch("httpx.get", side_effect=mocked_requests_get)
 #     def test_summarize(self, mocked_requests_get):
 #         """Tests that the summary of an experiment works as expected."""
@@ -8,21 +8,27 @@ import unittest
 from unittest.mock import patch
 from pathlib import Path
 
+import pytest
+
 from bb_wrapper.tunable_component.component import TunableComponent
 
+# The tests write to and clean the current directory, so they must run on
+# the same worker when running in parallel
+pytestmark = pytest.mark.xdist_group("current_directory")
+
 
-TEST_COMPONENT_CONFIG = Path(__file__).parent / \
-    "test_component_config" / "test.yaml"
+TEST_COMPONENT_CONFIG = (
+    Path(__file__).parent / "test_component_config" / "test.yaml"
+).resolve()
 # Test config component
 
-TEST_SBATCH = Path(__file__).parent / "test_data" / "test_sbatch.sbatch"
+TEST_SBATCH = (
+    Path(__file__).parent / "test_data" / "test_sbatch.sbatch"
+).resolve()
 # Test sbatch
 TEST_SBATCH_HEADER = Path(__file__).parent / \
     "test_data" / "test_sbatch_header.sbatch"
 
-# Save current environment variable into a variable
-current_var_env = os.environ.copy()
-
 
 class MockResponse:
     def __init__(self, json_data, status_code):
@@ -188,6 +194,34 @@ class TestTunableComponent(unittest.TestCase):
                 module_configuration="/file/which/does/not/exist.yaml",
             )
 
+    def test_configuration_directory(self):
+        """Check that a file not found error is raised when the configuration module is a
+        directory.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_dir = Path(tmp_dir) / "components.yaml"
+            config_dir.mkdir()
+            with self.assertRaises(FileNotFoundError):
+                TunableComponent(
+                    name="component_1",
+                    module_configuration=config_dir,
+                )
+
+    @patch(
+        "shaman_core.models.component_model.TunableComponentsModel.from_yaml",
+        side_effect=FileNotFoundError(2, "No such file", "/other/file"),
+    )
+    def test_configuration_other_file_not_found(self, mock_from_yaml):
+        """Check that a file not found error raised for another file than the configuration
+        module is not reported as a missing configuration.
+        """
+        with self.assertRaises(FileNotFoundError) as context:
+            TunableComponent(
+                name="component_1",
+                module_configuration=TEST_COMPONENT_CONFIG,
+            )
+        self.assertEqual(context.exception.filename, "/other/file")
+
     def test_configuration_wrong_format(self):
         """Check that if the configuration file has the wrong format an error is raised.
         """
@@ -227,6 +261,23 @@ class TestTunableComponent(unittest.TestCase):
         expected_cmdline = "example_cmd --folder /home/ -f /home/ param_4=5 -s 6K"
         self.assertEqual(tunable_component.cmd_line, expected_cmdline)
 
+    def test_cmd_line_built_once(self):
+        """Tests that the command line is only built on first access."""
+        tunable_component = TunableComponent(
+            name="component_2",
+            module_configuration=TEST_COMPONENT_CONFIG,
+            parameters={"param_3": "/home/", "param_4": "5", "param_5": "6"},
+        )
+        with patch.object(
+            tunable_component,
+            "build_cmd_line",
+            wraps=tunable_component.build_cmd_line,
+        ) as mock_build:
+            first_cmd_line = tunable_component.cmd_line
+            calls = mock_build.call_count
+            self.assertEqual(tunable_component.cmd_line, first_cmd_line)
+            self.assertEqual(mock_build.call_count, calls)
+
     def test_cmd_line_empty(self):
         """Tests that when the command line does not exist in the configuration file, an empty
         string is returned.
@@ -297,9 +348,8 @@ class TestTunableComponent(unittest.TestCase):
             "component_1", TEST_COMPONENT_CONFIG)
         tunable_component.setup_var_env()
         expected_var_env = {"param_1": "1"}
-        expected_var_env.update(current_var_env)
-        self.assertDictContainsSubset(
-            tunable_component.var_env, expected_var_env)
+        self.assertLessEqual(
+            expected_var_env.items(), tunable_component.var_env.items())
 
     def test_setup_var_env(self):
         """Tests that the environment variables are properly setup using non-default values."""
@@ -308,9 +358,36 @@ class TestTunableComponent(unittest.TestCase):
         )
         tunable_component.setup_var_env()
         expected_var_env = {"param_1": "10"}
-        expected_var_env.update(current_var_env)
-        self.assertDictContainsSubset(
-            tunable_component.var_env, expected_var_env)
+        self.assertLessEqual(
+            expected_var_env.items(), tunable_component.var_env.items())
+
+    def test_setup_var_env_once(self):
+        """Tests that setting up the environment variables several times
+        only does it once."""
+        tunable_component = TunableComponent(
+            "component_1", TEST_COMPONENT_CONFIG, {"param_1": 10}
+        )
+        tunable_component.setup_var_env()
+        var_env = tunable_component.var_env
+        tunable_component.setup_var_env()
+        self.assertIs(tunable_component.var_env, var_env)
+        self.assertEqual(tunable_component.var_env["param_1"], "10")
+
+    def test_setup_var_env_not_shared(self):
+        """Tests that the environment variables of a component are not shared with the other
+        components nor with the current environment."""
+        tunable_component = TunableComponent(
+            "component_1", TEST_COMPONENT_CONFIG, {"param_1": 10}
+        )
+        other_component = TunableComponent(
+            "component_1", TEST_COMPONENT_CONFIG, {"param_1": 20}
+        )
+        self.assertIsNone(tunable_component.var_env)
+        tunable_component.setup_var_env()
+        other_component.setup_var_env()
+        self.assertEqual(tunable_component.var_env["param_1"], "10")
+        self.assertEqual(other_component.var_env["param_1"], "20")
+        self.assertNotIn("param_1", os.environ)
 
     def test_optional_parameters(self):
         """Tests that when an optional parameter is specified, it is taken into account."""
@@ -331,17 +408,117 @@ class TestTunableComponent(unittest.TestCase):
             "component_1", TEST_COMPONENT_CONFIG)
         # Create new sbatch
         new_sbatch = tunable_component.add_header_sbatch(TEST_SBATCH)
-        # Checks that the header has been added
-        with open(new_sbatch, "r") as f:
-            lines = [line.strip() for line in f.readlines()]
-            self.assertTrue(tunable_component.description.header in lines)
-            self.assertTrue(
-                f"LD_PRELOAD={tunable_component.description.ld_preload}" in lines
-            )
-            self.assertTrue(tunable_component.cmd_line in lines)
-        # Close the file and remove the new sbatch
-        f.close()
-        os.remove(new_sbatch)
+        expected = frozenset((
+            tunable_component.description.header,
+            f"LD_PRELOAD={tunable_component.description.ld_preload}",
+            tunable_component.cmd_line,
+        ))
+        # Checks that the header has been added and remove the new sbatch
+        try:
+            with open(new_sbatch, "r") as f:
+                stripped = {line.strip() for line in f}
+            self.assertLessEqual(
+                expected, stripped, f"Missing lines: {expected - stripped}")
+        finally:
+            Path(new_sbatch).unlink()
+
+    def test_edit_sbatch_position(self):
+        """Tests that the header is written right after the last line of the sbatch header, and
+        that the rest of the file is copied unchanged."""
+        tunable_component = TunableComponent(
+            "component_1", TEST_COMPONENT_CONFIG)
+        new_sbatch = tunable_component.add_header_sbatch(TEST_SBATCH)
+        expected = (
+            "#!/bin/bash\n"
+            "#SBATCH --job-name=TestJob\n"
+            f"{tunable_component.cmd_line}\n"
+            f"{tunable_component.description.header}\n"
+            f"LD_PRELOAD={tunable_component.description.ld_preload}\n"
+            "hostname"
+        )
+        try:
+            self.assertEqual(Path(new_sbatch).read_text(), expected)
+        finally:
+            Path(new_sbatch).unlink()
+
+    def test_edit_sbatch_copy_tail(self):
+        """Tests that the lines following the header, including comments, are copied
+        unchanged."""
+        tunable_component = TunableComponent(
+            "component_3", TEST_COMPONENT_CONFIG, parameters={"param_1": 1})
+        tail = "srun hostname\n# comment\nsrun date\n"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sbatch = Path(tmp_dir) / "tail.sbatch"
+            sbatch.write_text("#!/bin/bash\n#SBATCH --job-name=TestJob\n" + tail)
+            new_sbatch = tunable_component.add_header_sbatch(sbatch)
+        try:
+            self.assertTrue(Path(new_sbatch).read_text().endswith(
+                f"LD_PRELOAD={tunable_component.description.ld_preload}\n" + tail))
+        finally:
+            Path(new_sbatch).unlink()
+
+    def test_edit_sbatch_read_once(self):
+        """Tests that the original sbatch is read only once when it is edited several times, and
+        read again once it has been modified."""
+        tunable_component = TunableComponent(
+            "component_3", TEST_COMPONENT_CONFIG, parameters={"param_1": 1})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sbatch = Path(tmp_dir) / "read_once.sbatch"
+            sbatch.write_text("#!/bin/bash\nsrun hostname\n")
+            new_sbatchs = [tunable_component.add_header_sbatch(sbatch)]
+            with patch("builtins.open", side_effect=open) as mocked_open:
+                new_sbatchs.append(tunable_component.add_header_sbatch(sbatch))
+                mocked_open.assert_not_called()
+            sbatch.write_text("#!/bin/bash\nsrun date\n")
+            new_sbatchs.append(tunable_component.add_header_sbatch(sbatch))
+        try:
+            self.assertEqual(
+                Path(new_sbatchs[0]).read_text(), Path(new_sbatchs[1]).read_text())
+            self.assertTrue(Path(new_sbatchs[2]).read_text().endswith("srun date\n"))
+        finally:
+            for new_sbatch in new_sbatchs:
+                Path(new_sbatch).unlink()
+
+    def _submit_with_fake_sbatch(self, script):
+        """Submits the test sbatch with the component 1, using a fake sbatch
+        command running the given shell script."""
+        tunable_component = TunableComponent(
+            "component_1", TEST_COMPONENT_CONFIG)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fake_sbatch = Path(tmp_dir) / "sbatch"
+            fake_sbatch.write_text(f"#!/bin/sh\n{script}\n")
+            fake_sbatch.chmod(0o755)
+            tunable_component.var_env = {"PATH": tmp_dir}
+            return tunable_component, tunable_component.submit_sbatch(
+                TEST_SBATCH)
+
+    def test_submit_sbatch_parse_jobid(self):
+        """Tests that the job id is parsed from the output of sbatch."""
+        tunable_component, job_id = self._submit_with_fake_sbatch(
+            "echo 'sbatch: some warning'\necho 'Submitted batch job 42'")
+        self.assertEqual(job_id, 42)
+        self.assertListEqual(tunable_component.submitted_jobids, [42])
+        self.assertTrue(tunable_component.jobid_submitted.is_set())
+
+    def test_submit_sbatch_removes_header(self):
+        """Tests that the sbatch with the header is a temporary copy, which is removed once
+        submitted."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            submitted = Path(tmp_dir) / "submitted"
+            self._submit_with_fake_sbatch(
+                f"for last; do :; done\necho \"$last\" > {submitted}\n"
+                "echo 'Submitted batch job 42'")
+            header_sbatch = Path(submitted.read_text().strip())
+        self.assertTrue(header_sbatch.name.startswith(f"{TEST_SBATCH.stem}_"))
+        self.assertTrue(header_sbatch.name.endswith("_header.sbatch"))
+        self.assertFalse(header_sbatch.exists())
+
+    def test_submit_sbatch_failure(self):
+        """Tests that an error containing the output of sbatch is raised
+        when the submission fails."""
+        with self.assertRaisesRegex(Exception, "Invalid account"):
+            self._submit_with_fake_sbatch(
+                "echo 'sbatch: error: Invalid account' >&2\nexit 1")
 
     def test_cmd_line(self):
         """Tests that the command line is correctly built, given the different
@@ -389,6 +566,18 @@ class TestTunableComponent(unittest.TestCase):
             "Problem with building command line building with cli vars activated.",
         )
 
+    def test_sbatch_cmd_arguments(self):
+        """Tests that the sbatch command is built as a list of arguments, which keeps the
+        paths with white spaces as a single argument."""
+        tunable_component_flag = TunableComponent(
+            "component_5", TEST_COMPONENT_CONFIG, parameters={}
+        )
+        self.assertListEqual(
+            tunable_component_flag._build_sbatch_cmd("my dir/test.sbatch", wait=True),
+            ["sbatch", "--wait", "--example_5", "--folder", "/home/", "-s", "5",
+             "param_3=4K", "my dir/test.sbatch"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 Module for unit-testing of the parsing plugins.
 """
 
+import tempfile
 import unittest
 from pathlib import Path
 from bb_wrapper.tunable_component.plugins.parse_execution_time import parse_milliseconds, parse_slurm_times
@@ -19,6 +20,15 @@ class TestParseTimePlugin(unittest.TestCase):
         time = parse_slurm_times("42", path=TEST_SLURMS)
         self.assertEqual(time, 1508.085)
 
+    def test_parse_slurm_times_not_in_tail(self):
+        """Tests that the slurm times are parsed from the whole file when they are not in the
+        last bytes of the slurm output file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (Path(tmp_dir) / "slurm-43.out").write_text(
+                "real\t1m2.5s\n" + "output line\n" * 1000)
+            time = parse_slurm_times("43", path=Path(tmp_dir))
+        self.assertEqual(time, 62.005)
+
     def test_parse_slurm_times_except_no_time(self):
         """ Test the "_parse_slurm_times" function raises a ValueError if the slurm output file does
         not contains the time."""
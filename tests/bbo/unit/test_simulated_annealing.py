@@ -12,6 +12,7 @@ Tests the various methods associated with simulated annealing:
 # Disable name too longs (necessary for clarity in testing)
 # pylint: disable=invalid-name
 
+import random
 import unittest
 import numpy as np
 
@@ -280,6 +281,22 @@ class TestRestartMethods(unittest.TestCase):
             t_max, real_t_max, "Maximal temperature was not computed properly."
         )
 
+    def test_random_restarts_rng(self):
+        """
+        Tests that the random restart method draws from the given random number generator.
+        """
+        draws = [
+            random_restart(
+                bernouilli_parameter=0.5, initial_temperature=10, rng=random.Random(0)
+            )[0]
+            for _ in range(2)
+        ]
+        self.assertEqual(draws[0], draws[1])
+        real_restart, _ = random_restart(
+            bernouilli_parameter=0, initial_temperature=10, rng=random.Random(0)
+        )
+        self.assertFalse(real_restart)
+
     def test_threshold_restarts(self):
         """
         Tests that the threshold restart method works properly.
@@ -331,6 +348,30 @@ class TestSimulatedAnnealing(unittest.TestCase):
                 restart=False,
             )
 
+    def test_simulated_annealing_wrong_restart_parameter(self):
+        """
+        Tests that the simulated annealing raises an error when given a restart parameter
+        which is not located between 0 and 1.
+        """
+        with self.assertRaises(ValueError):
+            SimulatedAnnealing(
+                initial_temperature=50,
+                neighbor_function=hop_to_next_value,
+                cooldown_function=multiplicative_schedule,
+                cooling_factor=2,
+                restart=random_restart,
+                bernouilli_parameter=2,
+            )
+        with self.assertRaises(ValueError):
+            SimulatedAnnealing(
+                initial_temperature=50,
+                neighbor_function=hop_to_next_value,
+                cooldown_function=multiplicative_schedule,
+                cooling_factor=2,
+                restart=threshold_restart,
+                probability_threshold=-1,
+            )
+
     def test_simulated_annealing_no_restart(self):
         """
         Tests that the simulated annealing heuristic restarts properly when not using any restart
@@ -356,6 +397,7 @@ class TestSimulatedAnnealing(unittest.TestCase):
         for finding the next relevant parameter.
         """
         np.random.seed(10)
+        random.seed(10)
         ranges = np.array([np.arange(20), np.arange(20)])
         sa = SimulatedAnnealing(
             initial_temperature=50,
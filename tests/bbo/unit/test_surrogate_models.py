@@ -12,6 +12,7 @@ Tests that the various methods associated with surrogate modeling:
 # pylint: disable=invalid-name
 
 import unittest
+from unittest.mock import patch
 import os
 import shutil
 import numpy as np
@@ -21,11 +22,14 @@ from numpy.testing._private.utils import assert_array_equal
 from sklearn.neighbors import KNeighborsRegressor
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeRegressor
 from bbo.heuristics.surrogate_models.regression_models import (
     DecisionTreeSTDRegressor,
     CensoredGaussianProcesses,
 )
 
+from bbo.heuristics.surrogate_models.fast_predict import compile_tree_predictor
+
 # Example of minimization function
 from bbo.heuristics.surrogate_models.surrogate_models import SurrogateModel
 from bbo.heuristics.surrogate_models.next_parameter_strategies import (
@@ -213,6 +217,91 @@ class TestSurrogateModels(unittest.TestCase):
         )
         surrogate_model.regression_function(fake_history, ranges)
 
+    def test_prediction_function_memoized(self):
+        """
+        Tests that the prediction function only calls the regression model once per data point.
+        """
+        surrogate_model = SurrogateModel(
+            regression_model=GaussianProcessRegressor,
+            next_parameter_strategy=expected_improvement,
+        )
+        prediction_function = surrogate_model.regression_function(fake_history, ranges)
+        with patch.object(
+            surrogate_model.regression_model,
+            "predict",
+            wraps=surrogate_model.regression_model.predict,
+        ) as mocked_predict:
+            first_prediction = prediction_function(np.array([[1, 2]]))
+            second_prediction = prediction_function(np.array([[1, 2]]))
+            prediction_function(np.array([[1, 2]]), return_std=True)
+        np.testing.assert_array_equal(first_prediction, second_prediction)
+        self.assertEqual(mocked_predict.call_count, 2)
+
+    def test_prediction_function_memoized_copy(self):
+        """
+        Tests that the memoized predictions are returned as copies, and that batches of data
+        points are not memoized.
+        """
+        surrogate_model = SurrogateModel(
+            regression_model=GaussianProcessRegressor,
+            next_parameter_strategy=expected_improvement,
+        )
+        prediction_function = surrogate_model.regression_function(fake_history, ranges)
+        first_prediction = prediction_function(np.array([[1, 2]]))
+        expected_prediction = np.copy(first_prediction)
+        first_prediction += 1
+        np.testing.assert_array_equal(
+            prediction_function(np.array([[1, 2]])), expected_prediction
+        )
+        with patch.object(
+            surrogate_model.regression_model,
+            "predict",
+            wraps=surrogate_model.regression_model.predict,
+        ) as mocked_predict:
+            prediction_function(np.array([[1, 2], [3, 4]]))
+            prediction_function(np.array([[1, 2], [3, 4]]))
+        self.assertEqual(mocked_predict.call_count, 2)
+
+    def test_scaled_parameters_buffer(self):
+        """
+        Tests that the parameters are scaled as with the scaler, into a buffer which is
+        reused when the history grows.
+        """
+        surrogate_model = SurrogateModel(
+            regression_model=GaussianProcessRegressor,
+            next_parameter_strategy=expected_improvement,
+        )
+        surrogate_model.regression_function(fake_history, ranges)
+        buffer = surrogate_model._scaled_parameters_buffer
+        np.testing.assert_array_almost_equal(
+            buffer[: len(fake_history["parameters"])],
+            surrogate_model.parameter_scaler.transform(fake_history["parameters"]),
+        )
+        grown_history = {
+            key: np.concatenate([value, value[:1]]) for key, value in fake_history.items()
+        }
+        surrogate_model.regression_function(grown_history, ranges)
+        self.assertIs(surrogate_model._scaled_parameters_buffer, buffer)
+
+    @unittest.skipIf(compile_tree_predictor() is None, "numba is not installed")
+    def test_fast_tree_prediction(self):
+        """
+        Tests that the compiled prediction of decision trees returns the same values as the
+        sklearn model.
+        """
+        surrogate_model = SurrogateModel(
+            regression_model=DecisionTreeRegressor,
+            next_parameter_strategy=expected_improvement,
+        )
+        prediction_function = surrogate_model.regression_function(fake_history, ranges)
+        self.assertIsNotNone(surrogate_model.fast_predictor)
+        grid = np.array(np.meshgrid(*ranges)).T.reshape(-1, 2)
+        scaled_grid = surrogate_model.parameter_scaler.transform(grid)
+        np.testing.assert_array_equal(
+            prediction_function(grid),
+            surrogate_model.regression_model.predict(scaled_grid),
+        )
+
     def test_choose_next_parameter_mpi(self):
         """
         Checks that the selection of the next parameter works properly when using MPI.
@@ -254,6 +343,29 @@ class TestSurrogateModels(unittest.TestCase):
         real_score = surrogate_model.evaluate_quality(fake_history)
         np.testing.assert_array_almost_equal(expected_score, real_score)
 
+    def test_evaluate_quality_memoized(self):
+        """
+        Tests that the score is only computed once for the same history, until
+        the model is fitted again.
+        """
+        surrogate_model = SurrogateModel(
+            regression_model=GaussianProcessRegressor,
+            next_parameter_strategy=expected_improvement,
+        )
+        surrogate_model.choose_next_parameter(fake_history, ranges)
+        with patch.object(
+            surrogate_model.regression_model,
+            "score",
+            wraps=surrogate_model.regression_model.score,
+        ) as mock_score:
+            first_score = surrogate_model.evaluate_quality(fake_history)
+            self.assertEqual(
+                surrogate_model.evaluate_quality(fake_history), first_score)
+            self.assertEqual(mock_score.call_count, 1)
+            surrogate_model.choose_next_parameter(fake_history, ranges)
+            surrogate_model.evaluate_quality(fake_history)
+            self.assertEqual(mock_score.call_count, 2)
+
     def test_hot_encoding(self):
         """Tests that the hot encoding feature works as expected by
         hot encoding an array.
@@ -2,9 +2,12 @@
 """
 Tests that the component model behaves as expected.
 """
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 from pathlib import Path
+from types import MappingProxyType
 
 from pydantic import ValidationError
 from shaman_core.models.component_model import (
@@ -15,18 +18,19 @@ from shaman_core.models.component_model import (
 from bb_wrapper.tunable_component.plugins.parse_execution_time import parse_slurm_times
 
 
-TEST_MODEL = {
+# The models are read-only, the parameters are given separately in each test
+TEST_MODEL = MappingProxyType({
     "header": "test",
     "command": "test",
     "ld_preload": "test",
-}
+})
 
-TEST_MODEL_FAKE_TARGET = {
+TEST_MODEL_FAKE_TARGET = MappingProxyType({
     "header": "test",
     "command": "test",
     "ld_preload": "test",
     "custom_target": "dont_exist"
-}
+})
 
 
 TEST_PARAMETERS_OK = {
@@ -78,8 +82,9 @@ TEST_PARAMETERS_WRONG_TYPE = {
     "param_1": {"type": "int", "default": "home", "optional": True, "env_var": True}
 }
 
-TEST_COMPONENT_CONFIG = Path(__file__).parent / \
-    "test_component_config" / "test.yaml"
+TEST_COMPONENT_CONFIG = (
+    Path(__file__).parent / "test_component_config" / "test.yaml"
+).resolve()
 
 
 class MockResponse:
@@ -221,59 +226,63 @@ class TestComponentModels(unittest.TestCase):
     def test_unknown_type(self):
         """Tests that an error is raised when the specified type is unknown.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_UNKNOWN_TYPE})
         with self.assertRaises(AttributeError):
-            TunableComponentModel(**TEST_MODEL)
+            TunableComponentModel(**TEST_MODEL, parameters=TEST_PARAMETERS_UNKNOWN_TYPE)
 
     def test_parameters_ok(self):
         """Tests that when the parameters are properly specified, everything is ok.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_OK})
-        tunable_component = TunableComponentModel(**TEST_MODEL)
+        tunable_component = TunableComponentModel(
+            **TEST_MODEL, parameters=TEST_PARAMETERS_OK
+        )
 
     def test_load_target(self):
         """Tests that the get_target function is properly loaded when given no value.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_OK})
-        tunable_component = TunableComponentModel(**TEST_MODEL)
+        tunable_component = TunableComponentModel(
+            **TEST_MODEL, parameters=TEST_PARAMETERS_OK
+        )
         self.assertEqual(tunable_component.get_target, parse_slurm_times)
 
     def test_load_wrong_target(self):
         """Tests that loading the wrong target returns an import error.
         """
-        TEST_MODEL_FAKE_TARGET.update({"parameters": TEST_PARAMETERS_OK})
         with self.assertRaises(ModuleNotFoundError):
-            TunableComponentModel(**TEST_MODEL_FAKE_TARGET).get_target
+            TunableComponentModel(
+                **TEST_MODEL_FAKE_TARGET, parameters=TEST_PARAMETERS_OK
+            ).get_target
 
     def test_parameters_suffix(self):
         """Tests that when there is a suffix, everything is ok.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_SUFFIX})
-        tunable_component = TunableComponentModel(**TEST_MODEL)
+        tunable_component = TunableComponentModel(
+            **TEST_MODEL, parameters=TEST_PARAMETERS_SUFFIX
+        )
         self.assertEqual(tunable_component.parameters["param_1"].suffix, "K")
 
     def test_parameters_cli_var(self):
         """Tests that when a variable is a CLI variable, everything is ok.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_CLI_VAR})
-        tunable_component = TunableComponentModel(**TEST_MODEL)
+        tunable_component = TunableComponentModel(
+            **TEST_MODEL, parameters=TEST_PARAMETERS_CLI_VAR
+        )
         self.assertEqual(tunable_component.parameters["param_1"].cli_var, True)
 
     def test_no_cmd_no_env(self):
         """Tests that when a parameter is not specified to be either a environment variable or a
         command line variable.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_NO_CMD_NO_ENV})
         with self.assertRaises(ValueError):
-            TunableComponentModel(**TEST_MODEL)
+            TunableComponentModel(
+                **TEST_MODEL, parameters=TEST_PARAMETERS_NO_CMD_NO_ENV
+            )
 
     def test_parameters_wrong_type(self):
         """Tests that when the type of the default does not match the announced type, a TypeError is
         raised.
         """
-        TEST_MODEL.update({"parameters": TEST_PARAMETERS_WRONG_TYPE})
         with self.assertRaises(ValidationError):
-            TunableComponentModel(**TEST_MODEL)
+            TunableComponentModel(**TEST_MODEL, parameters=TEST_PARAMETERS_WRONG_TYPE)
 
     def test_load_component_from_yaml(self):
         """
@@ -284,6 +293,28 @@ class TestComponentModels(unittest.TestCase):
         assert tunable_components.components["component_1"].plugin == "example_1"
         assert tunable_components.components["component_2"].plugin == "example_2"
 
+    def test_load_component_from_yaml_memoized(self):
+        """
+        Tests that loading the same YAML file twice returns the same model.
+        """
+        self.assertIs(
+            TunableComponentsModel.from_yaml(TEST_COMPONENT_CONFIG),
+            TunableComponentsModel.from_yaml(str(TEST_COMPONENT_CONFIG)),
+        )
+
+    def test_load_component_from_yaml_modified(self):
+        """
+        Tests that a YAML file is loaded again once it has been modified.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = Path(tmp_dir) / "test.yaml"
+            shutil.copy(TEST_COMPONENT_CONFIG, config)
+            TunableComponentsModel.from_yaml(config)
+            config.write_text(
+                config.read_text().replace("example_1", "example_10"))
+            tunable_components = TunableComponentsModel.from_yaml(config)
+            assert tunable_components.components["component_1"].plugin == "example_10"
+
     @patch("httpx.get", side_effect=mocked_requests_get)
     def test_load_component_from_api(self, mocked_request):
         """
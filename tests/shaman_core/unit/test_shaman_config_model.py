@@ -21,6 +21,8 @@ TEST_DATA = Path(__file__).parent / "test_shaman_config"
 VANILLA_CONFIG = TEST_DATA / "vanilla.yaml"
 VANILLA_CONFIG_WRONG = TEST_DATA / "vanilla_wrong_config.yaml"
 NOISE_REDUCTION_CONFIG = TEST_DATA / "noise_reduction.yaml"
+CACHE_REPEATS_NOISE_REDUCTION_CONFIG = \
+    TEST_DATA / "cache_repeats_noise_reduction.yaml"
 PRUNING_CONFIG = TEST_DATA / "pruning.yaml"
 
 
@@ -107,6 +109,11 @@ class TestSHAManModelVanilla(unittest.TestCase):
         shaman_config = SHAManConfig.from_yaml(VANILLA_CONFIG, "component_2")
         self.assertEqual(shaman_config.pruning, None)
 
+    def test_default_cache_repeats(self):
+        """Tests that the target values are not reused by default."""
+        shaman_config = SHAManConfig.from_yaml(VANILLA_CONFIG, "component_2")
+        self.assertFalse(shaman_config.experiment.cache_repeats)
+
     def test_empty_noise_reduction(self):
         """Tests that when there is no noise reduction, it returns None."""
         shaman_config = SHAManConfig.from_yaml(VANILLA_CONFIG, "component_2")
@@ -152,6 +159,8 @@ class TestSHAManNoiseReduction(unittest.TestCase):
         # Check that the estimator function is properly parsed
         self.assertEqual(
             shaman_config.bbo_parameters["estimator"], numpy.median)
+        # Check that the bbo section of the configuration is left untouched
+        assert "nbr_resamples" not in shaman_config.bbo
         # Check that the BBOptimizer class can be properly instanciated
         BBOptimizer(
             black_box=FakeBlackBox,
@@ -159,6 +168,12 @@ class TestSHAManNoiseReduction(unittest.TestCase):
             **shaman_config.bbo_parameters
         )
 
+    def test_noise_reduction_cache_repeats(self):
+        """Tests that reusing the target values is rejected when the noise is reduced."""
+        with self.assertRaises(ValueError):
+            SHAManConfig.from_yaml(
+                CACHE_REPEATS_NOISE_REDUCTION_CONFIG, "component_1")
+
 
 class TestSHAManPruning(unittest.TestCase):
     """